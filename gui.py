@@ -3,7 +3,25 @@ from tkinter import font
 from typing import Optional, Callable, List
 from tracker import TimeTracker
 
+def _font(root: tk.Misc, family: str, size: int, weight: str = "normal") -> font.Font:
+    """Get a Font shared by all widgets of root's Tk interpreter.
+
+    Named fonts belong to a single interpreter, so the cache lives on the
+    root window and goes away with it.
+    """
+    fonts = getattr(root, '_fonts', None)
+    if fonts is None:
+        fonts = root._fonts = {}
+
+    key = (family, size, weight)
+    if key not in fonts:
+        fonts[key] = font.Font(root=root, family=family, size=size, weight=weight)
+    return fonts[key]
+
 class CategoryPicker:
+    # Space taken by the title, current-session label and padding
+    CHROME_HEIGHT = 80
+
     def __init__(self, tracker: TimeTracker, on_selection: Optional[Callable[[str], None]] = None):
         self.tracker = tracker
         self.on_selection = on_selection
@@ -12,6 +30,12 @@ class CategoryPicker:
 
         self.root = tk.Tk()
         self.root.withdraw()  # Hide initially
+
+        # Row metrics are needed up front to size the window in one go
+        self._items = list(self.tracker.get_categories())
+        self._list_font = _font(self.root, "Consolas", 11)
+        self._row_height = self._list_font.metrics('linespace') + 4
+
         self._setup_window()
         self._create_widgets()
         self._bind_events()
@@ -19,15 +43,18 @@ class CategoryPicker:
     def _setup_window(self):
         """Configure the main window"""
         self.root.title("TimeCreator - Select Category")
-        self.root.geometry("300x200")
         self.root.resizable(False, False)
         self.root.configure(bg='#2d2d2d')
 
-        # Center window on screen
-        self.root.update_idletasks()
-        x = (self.root.winfo_screenwidth() // 2) - (300 // 2)
-        y = (self.root.winfo_screenheight() // 2) - (200 // 2)
-        self.root.geometry(f"300x200+{x}+{y}")
+        # Fit up to 10 rows below the title and current-session labels
+        width = 300
+        visible_rows = min(max(len(self._items), 1), 10)
+        height = self.CHROME_HEIGHT + visible_rows * self._row_height
+
+        # Center window on screen, applying the geometry once
+        x = (self.root.winfo_screenwidth() // 2) - (width // 2)
+        y = (self.root.winfo_screenheight() // 2) - (height // 2)
+        self.root.geometry(f"{width}x{height}+{x}+{y}")
 
         # Window should be on top and focused
         self.root.attributes('-topmost', True)
@@ -36,7 +63,7 @@ class CategoryPicker:
     def _create_widgets(self):
         """Create and layout widgets"""
         # Title
-        title_font = font.Font(family="Consolas", size=12, weight="bold")
+        title_font = _font(self.root, "Consolas", 12, "bold")
         title_label = tk.Label(
             self.root,
             text="Select Category",
@@ -60,7 +87,7 @@ class CategoryPicker:
         else:
             current_text = "No active session"
 
-        current_font = font.Font(family="Consolas", size=9)
+        current_font = _font(self.root, "Consolas", 9)
         current_label = tk.Label(
             self.root,
             text=current_text,
@@ -70,30 +97,23 @@ class CategoryPicker:
         )
         current_label.pack(pady=(0, 10))
 
-        # Category listbox
-        self.listbox = tk.Listbox(
+        # Category list: a Canvas that only draws the rows in view, so the
+        # picker stays fast no matter how many categories there are
+        self._top_index = 0
+        self._visible_rows = 1
+        self._canvas_width = 0
+
+        self.canvas = tk.Canvas(
             self.root,
-            font=font.Font(family="Consolas", size=11),
             bg='#3d3d3d',
-            fg='#ffffff',
-            selectbackground='#4a9eff',
-            selectforeground='#ffffff',
-            activestyle='none',
             highlightthickness=0,
             bd=0
         )
 
-        # Populate categories
-        categories = self.tracker.get_categories()
-        for category in categories:
-            self.listbox.insert(tk.END, category)
-
         # Select first item
-        if categories:
-            self.listbox.selection_set(0)
-            self.current_index = 0
+        self.current_index = 0
 
-        self.listbox.pack(fill=tk.BOTH, expand=True, padx=20, pady=(0, 20))
+        self.canvas.pack(fill=tk.BOTH, expand=True, padx=20, pady=(0, 20))
 
     def _bind_events(self):
         """Bind keyboard and mouse events"""
@@ -102,11 +122,15 @@ class CategoryPicker:
         self.root.bind('<Return>', lambda e: self._select_current())
         self.root.bind('<KP_Enter>', lambda e: self._select_current())
 
-        self.listbox.bind('<Double-Button-1>', lambda e: self._select_current())
-        self.listbox.bind('<<ListboxSelect>>', self._on_listbox_select)
+        self.canvas.bind('<Configure>', self._on_canvas_configure)
+        self.canvas.bind('<Button-1>', self._on_click)
+        self.canvas.bind('<Double-Button-1>', lambda e: self._select_current())
+        self.canvas.bind('<MouseWheel>', self._on_mousewheel)
+        self.canvas.bind('<Button-4>', lambda e: self._scroll(-1))  # X11 wheel up
+        self.canvas.bind('<Button-5>', lambda e: self._scroll(1))   # X11 wheel down
 
-        # Focus on listbox
-        self.listbox.focus_set()
+        # Focus on the list
+        self.canvas.focus_set()
 
     def _on_keypress(self, event):
         """Handle keyboard navigation"""
@@ -117,28 +141,75 @@ class CategoryPicker:
             self._move_selection(1)
             return 'break'
 
+    def _on_canvas_configure(self, event):
+        """Recompute how many rows fit and redraw"""
+        self._canvas_width = event.width
+        self._visible_rows = max(1, event.height // self._row_height)
+        self._scroll_into_view()
+        self._draw_rows()
+
+    def _draw_rows(self):
+        """Draw the visible slice of categories and the selection highlight"""
+        self.canvas.delete('rows')
+        row_height = self._row_height
+        end = min(self._top_index + self._visible_rows, len(self._items))
+
+        for index in range(self._top_index, end):
+            y = (index - self._top_index) * row_height
+            if index == self.current_index:
+                self.canvas.create_rectangle(
+                    0, y, self._canvas_width, y + row_height,
+                    fill='#4a9eff', outline='', tags='rows'
+                )
+            self.canvas.create_text(
+                4, y + row_height // 2,
+                text=self._items[index],
+                font=self._list_font,
+                fill='#ffffff',
+                anchor='w',
+                tags='rows'
+            )
+
+    def _scroll_into_view(self):
+        """Adjust the first visible row so the selection is on screen"""
+        if self.current_index < self._top_index:
+            self._top_index = self.current_index
+        elif self.current_index >= self._top_index + self._visible_rows:
+            self._top_index = self.current_index - self._visible_rows + 1
+
+    def _scroll(self, rows):
+        """Scroll the list by a number of rows"""
+        max_top = max(0, len(self._items) - self._visible_rows)
+        top = min(max(self._top_index + rows, 0), max_top)
+        if top != self._top_index:
+            self._top_index = top
+            self._draw_rows()
+
+    def _on_mousewheel(self, event):
+        """Handle mouse wheel scrolling (Windows/macOS)"""
+        self._scroll(-1 if event.delta > 0 else 1)
+
+    def _on_click(self, event):
+        """Highlight the clicked row"""
+        index = self._top_index + event.y // self._row_height
+        if index < len(self._items):
+            self.current_index = index
+            self._draw_rows()
+
     def _move_selection(self, direction):
         """Move selection up or down"""
-        size = self.listbox.size()
+        size = len(self._items)
         if size == 0:
             return
 
         self.current_index = (self.current_index + direction) % size
-        self.listbox.selection_clear(0, tk.END)
-        self.listbox.selection_set(self.current_index)
-        self.listbox.see(self.current_index)
-
-    def _on_listbox_select(self, event):
-        """Handle listbox selection change"""
-        selection = self.listbox.curselection()
-        if selection:
-            self.current_index = selection[0]
+        self._scroll_into_view()
+        self._draw_rows()
 
     def _select_current(self):
         """Select the currently highlighted category"""
-        selection = self.listbox.curselection()
-        if selection:
-            category = self.listbox.get(selection[0])
+        if self._items:
+            category = self._items[self.current_index]
             self.selected_category = category
             if self.on_selection:
                 self.on_selection(category)
@@ -162,7 +233,7 @@ def show_category_picker(tracker: TimeTracker) -> Optional[str]:
 
 def quick_switch_category(tracker: TimeTracker, category: str = None):
     """Quick switch to category or show picker if none specified"""
-    if category and category in tracker.get_categories():
+    if category and tracker.has_category(category):
         success = tracker.start_session(category)
         if success:
             print(f"Switched to: {category}")
@@ -6,22 +6,34 @@ Main launcher with hotkey support and status display
 
 import sys
 import argparse
-import threading
 import time
 import signal
+import concurrent.futures
 from typing import Optional
 
 from tracker import TimeTracker
-from status import StatusDisplay
-from gui import show_category_picker, quick_switch_category
-from overlay import MinimalOverlay
 
-try:
-    import keyboard
-    KEYBOARD_AVAILABLE = True
-except ImportError:
-    KEYBOARD_AVAILABLE = False
-    print("keyboard library not available - hotkeys disabled")
+# GUI modules (tkinter, pystray) and the optional keyboard library are
+# imported only by the commands that need them, so CLI commands start fast
+_keyboard = None
+_keyboard_checked = False
+
+def _get_keyboard():
+    """Import the keyboard library on first use (None if unavailable)"""
+    global _keyboard, _keyboard_checked
+    if not _keyboard_checked:
+        _keyboard_checked = True
+        try:
+            import keyboard
+            _keyboard = keyboard
+        except ImportError:
+            print("keyboard library not available - hotkeys disabled")
+    return _keyboard
+
+def _fmt_hm(duration: float) -> str:
+    """Format a duration in seconds as HH:MM"""
+    hours, rem = divmod(int(duration), 3600)
+    return f"{hours:02d}:{rem // 60:02d}"
 
 class TimeCreatorApp:
     def __init__(self, data_file: str = "data.json"):
@@ -29,35 +41,60 @@ class TimeCreatorApp:
         self.status_display = None
         self.hotkey_thread = None
         self.running = False
+        # One worker: at most a single picker window at a time
+        self._pool = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix="hotkey")
+        self._picker_open = False
+        self._hotkey_hook = None
 
     def _setup_hotkeys(self):
         """Setup global hotkeys"""
-        if not KEYBOARD_AVAILABLE:
+        keyboard = _get_keyboard()
+        if keyboard is None:
             return
 
         try:
-            # Ctrl+Alt+T to open picker
-            keyboard.add_hotkey('ctrl+alt+t', self._hotkey_picker)
-            # Ctrl+Alt+S to stop current session
-            keyboard.add_hotkey('ctrl+alt+s', self._hotkey_stop)
+            # One global hook dispatches every hotkey (see _on_key_event)
+            self._hotkey_hook = keyboard.hook(self._on_key_event)
             print("Hotkeys registered:")
             print("  Ctrl+Alt+T - Open category picker")
             print("  Ctrl+Alt+S - Stop current session")
         except Exception as e:
             print(f"Failed to register hotkeys: {e}")
 
+    def _on_key_event(self, event):
+        """Dispatch Ctrl+Alt hotkeys from the single keyboard hook"""
+        if event.event_type != 'down' or event.name not in ('t', 's'):
+            return
+        if not (_keyboard.is_pressed('ctrl') and _keyboard.is_pressed('alt')):
+            return
+
+        if event.name == 't':
+            # Ctrl+Alt+T to open picker
+            self._hotkey_picker()
+        else:
+            # Ctrl+Alt+S to stop current session
+            self._hotkey_stop()
+
     def _hotkey_picker(self):
         """Hotkey handler for category picker"""
+        # Ignore key-repeat while a picker is already showing
+        if self._picker_open:
+            return
+        self._picker_open = True
+
         def picker_thread():
             try:
+                from gui import show_category_picker
                 selected = show_category_picker(self.tracker)
                 if selected:
                     self.tracker.start_session(selected)
                     print(f"Switched to: {selected}")
             except Exception as e:
                 print(f"Error in picker: {e}")
+            finally:
+                self._picker_open = False
 
-        threading.Thread(target=picker_thread, daemon=True).start()
+        self._pool.submit(picker_thread)
 
     def _hotkey_stop(self):
         """Hotkey handler to stop current session"""
@@ -65,9 +102,7 @@ class TimeCreatorApp:
         if session:
             duration = self.tracker.get_session_duration(session)
             if duration:
-                hours = int(duration // 3600)
-                minutes = int((duration % 3600) // 60)
-                print(f"Stopped {session['category']} - Duration: {hours:02d}:{minutes:02d}")
+                print(f"Stopped {session['category']} - Duration: {_fmt_hm(duration)}")
             else:
                 print(f"Stopped {session['category']}")
         else:
@@ -100,6 +135,7 @@ class TimeCreatorApp:
 
         # Start minimal overlay (this will block)
         try:
+            from overlay import MinimalOverlay
             overlay = MinimalOverlay(self.tracker)
             overlay.start()
         except KeyboardInterrupt:
@@ -128,9 +164,7 @@ class TimeCreatorApp:
         if current:
             duration = self.tracker.get_current_duration()
             if duration:
-                hours = int(duration // 3600)
-                minutes = int((duration % 3600) // 60)
-                print(f"Current session: {current['category']} ({hours:02d}:{minutes:02d})")
+                print(f"Current session: {current['category']} ({_fmt_hm(duration)})")
             else:
                 print(f"Current session: {current['category']}")
         else:
@@ -138,6 +172,7 @@ class TimeCreatorApp:
 
         # Start status display (this will block)
         try:
+            from status import StatusDisplay
             self.status_display = StatusDisplay(self.tracker)
             self.status_display.start()
         except KeyboardInterrupt:
@@ -150,24 +185,26 @@ class TimeCreatorApp:
         """Stop the daemon"""
         self.running = False
 
-        if KEYBOARD_AVAILABLE:
+        # Only unhook if _setup_hotkeys actually registered something
+        if self._hotkey_hook is not None:
+            hook, self._hotkey_hook = self._hotkey_hook, None
             try:
-                keyboard.unhook_all_hotkeys()
-            except:
-                pass
+                _keyboard.unhook(hook)
+            except Exception as e:
+                print(f"Failed to unregister hotkeys: {e}")
 
         if self.status_display:
             self.status_display.stop()
 
+        self._pool.shutdown(wait=False)
+
     def cmd_status(self):
         """Show current status"""
         current = self.tracker.get_current_session()
         if current:
             duration = self.tracker.get_current_duration()
             if duration:
-                hours = int(duration // 3600)
-                minutes = int((duration % 3600) // 60)
-                print(f"Active: {current['category']} ({hours:02d}:{minutes:02d})")
+                print(f"Active: {current['category']} ({_fmt_hm(duration)})")
             else:
                 print(f"Active: {current['category']}")
         else:
@@ -187,9 +224,7 @@ class TimeCreatorApp:
         if session:
             duration = self.tracker.get_session_duration(session)
             if duration:
-                hours = int(duration // 3600)
-                minutes = int((duration % 3600) // 60)
-                print(f"Stopped: {session['category']} - Duration: {hours:02d}:{minutes:02d}")
+                print(f"Stopped: {session['category']} - Duration: {_fmt_hm(duration)}")
             else:
                 print(f"Stopped: {session['category']}")
         else:
@@ -197,6 +232,7 @@ class TimeCreatorApp:
 
     def cmd_picker(self):
         """Show category picker"""
+        from gui import show_category_picker
         selected = show_category_picker(self.tracker)
         if selected:
             self.tracker.start_session(selected)
@@ -229,14 +265,21 @@ class TimeCreatorApp:
             start_time = session['start'][:16].replace('T', ' ')  # Remove seconds and timezone
 
             if duration:
-                hours = int(duration // 3600)
-                minutes = int((duration % 3600) // 60)
-                duration_str = f"{hours:02d}:{minutes:02d}"
+                duration_str = _fmt_hm(duration)
             else:
                 duration_str = "??:??"
 
             print(f"  {start_time} - {session['category']} ({duration_str})")
 
+    def cmd_rollup(self):
+        """Roll past months' daily files up into one file per month"""
+        from tracker_daily import DailyTracker
+        months = DailyTracker().roll_up_past_months()
+        if months:
+            print(f"Rolled up {', '.join(months)}")
+        else:
+            print("No past months to roll up")
+
     def cmd_stats(self):
         """Show daily statistics"""
         stats = self.tracker.get_daily_stats()
@@ -277,6 +320,7 @@ def main():
     history_parser = subparsers.add_parser('history', help='Show session history')
     history_parser.add_argument('--limit', type=int, default=10, help='Number of sessions to show')
     subparsers.add_parser('stats', help='Show daily statistics')
+    subparsers.add_parser('rollup', help="Roll past months' daily files up into monthly files")
 
     args = parser.parse_args()
 
@@ -302,6 +346,8 @@ def main():
         app.cmd_history(args.limit)
     elif args.command == 'stats':
         app.cmd_stats()
+    elif args.command == 'rollup':
+        app.cmd_rollup()
     else:
         # Default to overlay if no command given
         app.start_overlay()
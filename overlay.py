@@ -1,20 +1,44 @@
 import tkinter as tk
-from tkinter import font
 import threading
+import concurrent.futures
 from typing import Optional
 from tracker_daily import TimeTracker
-from gui import show_category_picker
+from gui import show_category_picker, _font
 from stats_gui_minimal import show_minimal_stats_window
 
 class MinimalOverlay:
+    # Background color per category (anything else uses DEFAULT_COLOR)
+    CATEGORY_COLORS = {
+        'programming': '#2E8B57',     # Sea green
+        'wasted': '#8B4513',          # Brown
+        'Asset Creation': '#4682B4',  # Steel blue
+        'Math': '#9370DB',            # Medium purple
+        'stop': '#2d2d2d'             # Dark gray
+    }
+    DEFAULT_COLOR = '#4682B4'         # Steel blue
+
     def __init__(self, tracker: TimeTracker):
         self.tracker = tracker
+        # Keeps launch.py rollup from deleting the daily files this tracker caches
+        if not tracker.hold_data_lock():
+            print("Could not lock the data directory; a rollup may be running")
         self.root = tk.Tk()
+        self._button_font = _font(self.root, "Segoe UI", 9)
         self.running = False
-        self.update_thread = None
+        self._after_id = None
         self.expanded = False
-        self.category_buttons = []
+        self.category_buttons = {}
         self.base_height = 30
+        self._last_state = None
+        self._built_for_categories = None
+        self._hidden_category = None
+        self._menu_categories = None
+        self._update_scheduled = False
+        # Tracker writes run on one background worker (serialized, in order)
+        self._io_pool = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix="overlay-io")
+        self._pending_category = None
+        # Numbers each switch, so a finished save only clears the pending category if no newer switch followed
+        self._switch_seq = 0
 
         self._setup_window()
         self._create_widgets()
@@ -32,7 +56,12 @@ class MinimalOverlay:
 
         # Set window properties
         self.root.attributes('-topmost', True)  # Always on top
-        self.root.attributes('-alpha', 0.85)    # Slightly transparent
+        # Slightly transparent while in use, opaque while idle so the
+        # compositor can cache the window instead of re-blending it
+        self._active_alpha = 0.85
+        self._idle_alpha = 1.0
+        self._alpha = self._idle_alpha
+        self.root.attributes('-alpha', self._alpha)
 
         # Make sure window can receive focus and clicks
         self.root.focus_set()
@@ -64,7 +93,7 @@ class MinimalOverlay:
         self.category_label = tk.Label(
             self.main_frame,
             text="No session",
-            font=font.Font(family="Segoe UI", size=9, weight="normal"),
+            font=_font(self.root, "Segoe UI", 9),
             bg='#2d2d2d',
             fg='#ffffff',
             padx=8,
@@ -75,14 +104,26 @@ class MinimalOverlay:
 
         # Frame for category buttons (initially hidden)
         self.button_frame = tk.Frame(self.main_frame, bg='#2d2d2d')
+        # Height is set explicitly in _expand rather than computed from children
+        self.button_frame.pack_propagate(False)
         # Don't pack initially - will be shown/hidden on click
 
+        # Right-click menu, built once and refreshed when categories change
+        self._context_menu = tk.Menu(self.root, tearoff=0)
+        self._context_menu.configure(bg='#3d3d3d', fg='#ffffff',
+                                     activebackground='#4a9eff', activeforeground='#ffffff')
+        self._populate_context_menu()
+
     def _bind_events(self):
         """Bind click events"""
         # Only bind to the label to avoid multiple triggers
         self.category_label.bind('<Button-1>', self._on_click)
         self.category_label.bind('<Button-3>', self._on_right_click)
 
+        # Translucent only while the pointer is over the overlay
+        self.root.bind('<Enter>', lambda e: self._set_alpha(self._active_alpha))
+        self.root.bind('<Leave>', self._on_leave)
+
         # Make window draggable
         self._setup_dragging()
 
@@ -105,6 +146,24 @@ class MinimalOverlay:
         self.category_label.bind('<ButtonPress-2>', start_drag)
         self.category_label.bind('<B2-Motion>', do_drag)
 
+    def _set_alpha(self, alpha: float):
+        """Change window transparency, skipping no-op updates"""
+        if alpha != self._alpha:
+            self._alpha = alpha
+            self.root.attributes('-alpha', alpha)
+
+    def _on_leave(self, event):
+        """Go back to the opaque idle look once the pointer left the overlay"""
+        if not self.expanded:
+            self._go_idle_if_pointer_outside()
+
+    def _go_idle_if_pointer_outside(self):
+        """Switch to idle alpha unless the pointer is over one of our widgets"""
+        # Leave also fires when moving between child widgets
+        x, y = self.root.winfo_pointerxy()
+        if self.root.winfo_containing(x, y) is None:
+            self._set_alpha(self._idle_alpha)
+
     def _on_click(self, event):
         """Handle left click - toggle category list"""
         if self.expanded:
@@ -117,30 +176,72 @@ class MinimalOverlay:
 
     def _on_right_click(self, event):
         """Handle right click - show simple context menu"""
-        context_menu = tk.Menu(self.root, tearoff=0)
-        context_menu.configure(bg='#3d3d3d', fg='#ffffff',
-                              activebackground='#4a9eff', activeforeground='#ffffff')
+        # Rebuild the menu entries only after the category list changed
+        if self._menu_categories != self._categories():
+            self._populate_context_menu()
+
+        try:
+            self._context_menu.tk_popup(event.x_root, event.y_root)
+        finally:
+            self._context_menu.grab_release()
+
+    def _populate_context_menu(self):
+        """Fill the context menu with the current categories"""
+        categories = self._categories()
+        menu = self._context_menu
+        menu.delete(0, 'end')
 
         # Quick category switches
-        for category in self.tracker.get_categories():
-            context_menu.add_command(
+        for category in categories:
+            menu.add_command(
                 label=category,
                 command=lambda c=category: self._quick_switch(c)
             )
 
-        context_menu.add_separator()
-        context_menu.add_command(label="Show Stats", command=self._show_stats)
-        context_menu.add_command(label="Exit", command=self._exit)
+        menu.add_separator()
+        menu.add_command(label="Show Stats", command=self._show_stats)
+        menu.add_command(label="Exit", command=self._exit)
+        self._menu_categories = categories
 
-        try:
-            context_menu.tk_popup(event.x_root, event.y_root)
-        finally:
-            context_menu.grab_release()
+    def _categories(self):
+        """Get the tracker's categories (a cached tuple, replaced only when they change)"""
+        return self.tracker.get_categories()
 
     def _quick_switch(self, category: str):
         """Quickly switch to a category"""
-        self.tracker.start_session(category)
-        self._update_display()
+        self._switch_to(category)
+
+    def _switch_to(self, category: str):
+        """Show the new category right away and save the switch in the background"""
+        self._switch_seq += 1
+        seq = self._switch_seq
+        self._pending_category = category
+        self._schedule_update()
+
+        future = self._io_pool.submit(self.tracker.start_session, category)
+        future.add_done_callback(lambda f: self._switch_saved(seq, category, f))
+
+    def _switch_saved(self, seq: int, category: str, future):
+        """Called on the I/O worker once start_session finished; hands the result to the Tk thread"""
+        if self.running:
+            self.root.after(0, self._switch_done, seq, category, future)
+
+    def _switch_done(self, seq: int, category: str, future):
+        """Finish a switch on the Tk thread"""
+        if future.exception():
+            print(f"Error switching to {category}: {future.exception()}")
+        # A newer switch may already be pending; only clear our own
+        if seq == self._switch_seq:
+            self._pending_category = None
+        self._schedule_update()
+
+    def _current_category(self) -> Optional[str]:
+        """Category being tracked, including a switch still being saved"""
+        if self._pending_category is not None:
+            # Switching to 'stop' ends the session, like the tracker does
+            return None if self._pending_category == 'stop' else self._pending_category
+        current = self.tracker.get_current_session()
+        return current['category'] if current else None
 
     def _show_stats(self):
         """Show the stats window"""
@@ -158,38 +259,73 @@ class MinimalOverlay:
             return
 
         self.expanded = True
+        self._set_alpha(self._active_alpha)
+
+        # Create buttons for each category
+        categories = self._categories()
+        current_category = self._current_category()
+
+        # Buttons are only rebuilt when the category list itself changes
+        rebuilt = categories != self._built_for_categories
+        if rebuilt:
+            self._build_category_buttons(categories)
+            self._built_for_categories = categories
+
+        # Hide the current category's button (re-pack only after a switch)
+        if rebuilt or current_category != self._hidden_category:
+            for btn in self.category_buttons.values():
+                btn.pack_forget()
+            for category, btn in self.category_buttons.items():
+                if category != current_category:
+                    btn.pack(fill=tk.X, padx=0, pady=(1, 0))
+            self._hidden_category = current_category
+
+        # Show the button frame, pre-sized so Tk doesn't measure each child
+        button_count = len(self.category_buttons) - (current_category in self.category_buttons)
+        self.button_frame.configure(height=button_count * 25)  # 25px per button
+        self.button_frame.pack(fill=tk.X, pady=(1, 0))
+
+        # Resize window to fit all buttons once Tk has finished laying out
+        new_height = self.initial_height + (button_count * 25)
+        self.root.after_idle(self._resize_height, new_height)
+
+        # Collapse on clicks outside the overlay. Tk only sees clicks in our
+        # own windows (e.g. the stats window), so focus loss still covers
+        # clicks in other applications.
+        self.root.bind_all('<Button-1>', self._maybe_collapse, add='+')
+        self.root.bind('<FocusOut>', lambda e: self._collapse())
+
+    def _maybe_collapse(self, event):
+        """Collapse when a click lands outside the overlay window"""
+        left = self.root.winfo_rootx()
+        top = self.root.winfo_rooty()
+        inside = (left <= event.x_root < left + self.root.winfo_width() and
+                  top <= event.y_root < top + self.root.winfo_height())
+        if not inside:
+            self._collapse()
+
+    def _resize_height(self, height: int):
+        """Set the window height, keeping its current (possibly dragged) position"""
+        # Get current position instead of using initial position
+        current_x = self.root.winfo_x()
+        current_y = self.root.winfo_y()
+        self.root.geometry(f"{self.width}x{height}+{current_x}+{current_y}")
 
+    def _build_category_buttons(self, categories):
+        """(Re)create one button per category; _expand decides which are shown"""
         # Clear any existing buttons
         for widget in self.button_frame.winfo_children():
             widget.destroy()
         self.category_buttons.clear()
 
-        # Create buttons for each category
-        categories = self.tracker.get_categories()
-        current_category = None
-        current_session = self.tracker.get_current_session()
-        if current_session:
-            current_category = current_session['category']
-
         for category in categories:
-            # Skip current category
-            if category == current_category:
-                continue
-
             # Determine button color based on category
-            category_colors = {
-                'programming': '#2E8B57',     # Sea green
-                'wasted': '#8B4513',          # Brown
-                'Asset Creation': '#4682B4',  # Steel blue
-                'Math': '#9370DB',            # Medium purple
-                'stop': '#2d2d2d'             # Dark gray
-            }
-            bg_color = category_colors.get(category, '#4682B4')  # Default to steel blue
+            bg_color = self.CATEGORY_COLORS.get(category, self.DEFAULT_COLOR)
 
             btn = tk.Label(
                 self.button_frame,
                 text=category,
-                font=font.Font(family="Segoe UI", size=9, weight="normal"),
+                font=self._button_font,
                 bg=bg_color,
                 fg='#ffffff',
                 padx=8,
@@ -199,23 +335,7 @@ class MinimalOverlay:
 
             # Bind click event
             btn.bind('<Button-1>', lambda e, cat=category: self._select_category(cat))
-            btn.pack(fill=tk.X, padx=0, pady=(1, 0))
-            self.category_buttons.append(btn)
-
-        # Show the button frame
-        self.button_frame.pack(fill=tk.X, pady=(1, 0))
-
-        # Resize window to fit all buttons
-        button_count = len(self.category_buttons)
-        new_height = self.initial_height + (button_count * 25)  # 25px per button
-
-        # Get current position instead of using initial position
-        current_x = self.root.winfo_x()
-        current_y = self.root.winfo_y()
-        self.root.geometry(f"{self.width}x{new_height}+{current_x}+{current_y}")
-
-        # Bind click outside to collapse
-        self.root.bind('<FocusOut>', lambda e: self._collapse())
+            self.category_buttons[category] = btn
 
     def _collapse(self):
         """Hide category buttons"""
@@ -227,58 +347,70 @@ class MinimalOverlay:
         # Hide button frame
         self.button_frame.pack_forget()
 
-        # Resize window back to original size
-        current_x = self.root.winfo_x()
-        current_y = self.root.winfo_y()
-        self.root.geometry(f"{self.width}x{self.initial_height}+{current_x}+{current_y}")
+        # Resize window back to original size (queued behind any pending expand resize)
+        self.root.after_idle(self._resize_height, self.initial_height)
 
-        # Remove focus out binding
+        # Remove outside-click bindings
+        self.root.unbind_all('<Button-1>')
         self.root.unbind('<FocusOut>')
 
+        # Drop transparency unless the pointer is still over the overlay
+        self._go_idle_if_pointer_outside()
+
     def _select_category(self, category: str):
         """Select a category and switch to it"""
-        self.tracker.start_session(category)
-        self._update_display()
+        self._switch_to(category)
         self._collapse()
 
     def _exit(self):
         """Exit the overlay"""
         self.stop()
 
+    def _schedule_update(self):
+        """Coalesce display updates into one repaint when Tk goes idle"""
+        if self._update_scheduled:
+            return
+        self._update_scheduled = True
+        self.root.after_idle(self._do_update)
+
+    def _do_update(self):
+        """Run the display update requested by _schedule_update"""
+        self._update_scheduled = False
+        self._update_display()
+
     def _update_display(self):
         """Update the category display"""
-        current = self.tracker.get_current_session()
+        category = self._current_category()
 
-        if current and current['category'] != 'stop':
-            category_text = current['category']
+        if category and category != 'stop':
+            category_text = category
             # Change color based on category
-            category_colors = {
-                'programming': '#2E8B57',     # Sea green
-                'wasted': '#8B4513',          # Brown
-                'Asset Creation': '#4682B4',  # Steel blue
-                'Math': '#9370DB',            # Medium purple
-            }
-            bg_color = category_colors.get(current['category'], '#4682B4')  # Default to steel blue
+            bg_color = self.CATEGORY_COLORS.get(category_text, self.DEFAULT_COLOR)
             fg_color = '#ffffff'
         else:
             category_text = "No session"
             bg_color = '#2d2d2d'  # Dark gray for no session
             fg_color = '#888888'
 
+        # Skip the redraw when nothing changed since the last update
+        state = (category_text, bg_color, fg_color)
+        if state == self._last_state:
+            return
+        self._last_state = state
+
         # Update label
         self.category_label.config(text=category_text, bg=bg_color, fg=fg_color)
         self.root.configure(bg=bg_color)
 
-    def _update_loop(self):
-        """Background update loop"""
-        while self.running:
-            try:
-                self._update_display()
-                # Update every 10 seconds (just to catch external changes)
-                threading.Event().wait(10)
-            except Exception as e:
-                print(f"Error updating overlay: {e}")
-                threading.Event().wait(5)
+    def _tick(self):
+        """Periodic refresh, scheduled on the Tk event loop"""
+        try:
+            self._update_display()
+        except Exception as e:
+            print(f"Error updating overlay: {e}")
+
+        # Update every 10 seconds (just to catch external changes)
+        self._after_id = self.root.after(10000, self._tick)
 
     def start(self):
         """Start the overlay"""
@@ -287,12 +419,8 @@ class MinimalOverlay:
 
         self.running = True
 
-        # Initial display update
-        self._update_display()
-
-        # Start background update thread
-        self.update_thread = threading.Thread(target=self._update_loop, daemon=True)
-        self.update_thread.start()
+        # Initial display update, then keep refreshing from the Tk event loop
+        self._tick()
 
         # Start the GUI main loop
         try:
@@ -304,6 +432,19 @@ class MinimalOverlay:
         """Stop the overlay"""
         self.running = False
 
+        if self._after_id:
+            self.root.after_cancel(self._after_id)
+            self._after_id = None
+
+        # Let queued session writes finish before exiting, then write the totals index they updated.
+        # Tk keeps running meanwhile, since a finishing write may be waiting on root.after
+        flushed = self._io_pool.submit(lambda: None)
+        while not flushed.done():
+            self.root.update()
+            concurrent.futures.wait([flushed], timeout=0.05)
+        self._io_pool.shutdown(wait=True)
+        self.tracker.flush_index()
+
         if self.root:
             self.root.quit()
             self.root.destroy()
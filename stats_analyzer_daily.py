@@ -1,198 +1,284 @@
 import json
-from datetime import datetime, timedelta, timezone
-from typing import Dict, List, Tuple, Any
-from collections import defaultdict
+from datetime import date, datetime, timedelta, timezone
+from typing import Dict, List, NamedTuple, Tuple, Any
 import calendar
+import functools
+import inspect
+from operator import itemgetter
+
+WEEKDAY_NAMES = ('Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday')
+
+def _memoized(method):
+    """Cache a DailyStatsAnalyzer method's result per argument tuple"""
+    signature = inspect.signature(method)
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        # Normalize arguments so f(), f(365) and f(days_back=365) share one cache entry
+        bound = signature.bind(self, *args, **kwargs)
+        bound.apply_defaults()
+        return self._cached((method.__name__,) + bound.args[1:], lambda: method(*bound.args))
+    return wrapper
+
+class CalendarDay(NamedTuple):
+    """One day of the productivity calendar"""
+    date: str
+    total_hours: float
+    categories: Dict[str, float]
+    category_segments: List[Dict[str, Any]]
+    weekday: int
+    week_of_year: int
+
+    @classmethod
+    def empty(cls, date_str: str) -> 'CalendarDay':
+        """Placeholder for a day without tracked time"""
+        day = date.fromisoformat(date_str)
+        return cls(date_str, 0, {}, [], day.weekday(), day.isocalendar()[1])
+
+def _date_range_strs(start: date, count: int) -> List[str]:
+    """List count consecutive 'YYYY-MM-DD' strings starting at start"""
+    start_ord = start.toordinal()
+    return [date.fromordinal(start_ord + i).isoformat() for i in range(count)]
 
 class DailyStatsAnalyzer:
     def __init__(self, tracker):
         self.tracker = tracker
-
-    def get_date_range(self, days_back: int = 365) -> Tuple[datetime, datetime]:
-        """Get date range for analysis"""
-        end_date = datetime.now(timezone.utc).replace(hour=23, minute=59, second=59, microsecond=999999)
+        # Memoized results, valid until the tracker's data or categories change or the day rolls over
+        self._cache = {}
+        self._cache_token = None
+
+    def _cached(self, key, compute):
+        """Return the cached result for key, computing it on a miss"""
+        token = (self.tracker.data_version, self.tracker.categories_version, datetime.now(timezone.utc).date())
+        if token != self._cache_token:
+            self._cache.clear()
+            self._cache_token = token
+
+        if key not in self._cache:
+            self._cache[key] = compute()
+        return self._cache[key]
+
+    def get_date_range(self, days_back: int = 365) -> Tuple[date, date]:
+        """Get date range for analysis (inclusive, ending today in UTC)"""
+        end_date = datetime.now(timezone.utc).date()
         start_date = end_date - timedelta(days=days_back)
         return start_date, end_date
 
+    @_memoized
     def get_daily_totals(self, days_back: int = 365) -> Dict[str, Dict[str, float]]:
         """Get total hours per category per day using daily files"""
         start_date, end_date = self.get_date_range(days_back)
-        daily_totals = {}
-
-        current_date = start_date
-        while current_date <= end_date:
-            date_str = current_date.strftime('%Y-%m-%d')
-            daily_stats = self.tracker.get_daily_stats(date_str)
-            if daily_stats:
-                daily_totals[date_str] = daily_stats
-            current_date += timedelta(days=1)
-
-        return daily_totals
+        daily_stats = self.tracker.get_daily_stats_range(start_date.isoformat(), end_date.isoformat())
+        return {date_str: stats for date_str, stats in daily_stats.items() if stats}
 
+    @_memoized
     def get_category_totals(self, days_back: int = 365) -> Dict[str, Dict[str, Any]]:
         """Get comprehensive stats per category"""
         return self.tracker.get_category_totals(days_back)
 
-    def get_productivity_calendar(self, days_back: int = 365) -> List[Dict[str, Any]]:
-        """Generate calendar data with category breakdown for progress bars"""
-        daily_totals = self.get_daily_totals(days_back)
+    @_memoized
+    def get_productivity_calendar(self, days_back: int = 365, sparse: bool = False) -> List[CalendarDay]:
+        """Generate calendar data with category breakdown for progress bars (sparse: only days with data)"""
         start_date, end_date = self.get_date_range(days_back)
+        daily_stats = self.tracker.get_daily_stats_range(start_date.isoformat(), end_date.isoformat())
 
         calendar_data = []
-        current_date = start_date
+        date_strs = list(daily_stats) if sparse else _date_range_strs(start_date, days_back + 1)
 
-        while current_date <= end_date:
-            date_str = current_date.strftime('%Y-%m-%d')
-            day_data = daily_totals.get(date_str, {})
+        for date_str in date_strs:
+            day_data = daily_stats.get(date_str) or {}
+            if sparse and not day_data:
+                continue
+            current_date = date.fromisoformat(date_str)
             day_total = sum(day_data.values())
 
             # Create category segments for progress bar
-            category_segments = []
             if day_total > 0:
-                for category, hours in sorted(day_data.items(), key=lambda x: x[1], reverse=True):
-                    if hours > 0:
-                        percentage = (hours / day_total) * 100
-                        category_segments.append({
-                            'category': category,
-                            'hours': hours,
-                            'percentage': percentage
-                        })
-
-            calendar_data.append({
-                'date': date_str,
-                'total_hours': day_total,
-                'categories': day_data,
-                'category_segments': category_segments,
-                'weekday': current_date.weekday(),
-                'week_of_year': current_date.isocalendar()[1]
-            })
-
-            current_date += timedelta(days=1)
+                inv_pct = 100.0 / day_total
+                category_segments = [
+                    {'category': category, 'hours': hours, 'percentage': hours * inv_pct}
+                    for category, hours in sorted(day_data.items(), key=itemgetter(1), reverse=True)
+                    if hours > 0
+                ]
+            else:
+                category_segments = []
+
+            calendar_data.append(CalendarDay(
+                date=date_str,
+                total_hours=day_total,
+                categories=day_data,
+                category_segments=category_segments,
+                weekday=current_date.weekday(),
+                week_of_year=current_date.isocalendar()[1]
+            ))
 
         return calendar_data
 
+    @_memoized
+    def get_productivity_calendar_by_date(self, days_back: int = 365) -> Dict[str, CalendarDay]:
+        """Get the days with data from the productivity calendar, keyed by date"""
+        return {day.date: day for day in self.get_productivity_calendar(days_back, sparse=True)}
+
+    @_memoized
     def get_weekly_patterns(self) -> Dict[str, Dict[str, float]]:
         """Analyze patterns by day of week"""
         daily_totals = self.get_daily_totals()
-        weekday_totals = defaultdict(lambda: defaultdict(list))
+        # Flat accumulators keyed by (weekday index, category)
+        sums = {}
+        counts = {}
 
         for date_str, day_data in daily_totals.items():
-            date = datetime.strptime(date_str, '%Y-%m-%d')
-            weekday = date.strftime('%A')
+            # Slice the 'YYYY-MM-DD' key directly rather than going through strptime
+            weekday = calendar.weekday(int(date_str[:4]), int(date_str[5:7]), int(date_str[8:10]))
 
             for category, hours in day_data.items():
-                weekday_totals[weekday][category].append(hours)
+                key = (weekday, category)
+                sums[key] = sums.get(key, 0.0) + hours
+                counts[key] = counts.get(key, 0) + 1
 
         # Calculate averages
-        weekday_averages = {}
-        for weekday in ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']:
-            weekday_averages[weekday] = {}
-            for category, hours_list in weekday_totals[weekday].items():
-                weekday_averages[weekday][category] = sum(hours_list) / len(hours_list) if hours_list else 0
+        weekday_averages = {name: {} for name in WEEKDAY_NAMES}
+        for (weekday, category), total in sums.items():
+            weekday_averages[WEEKDAY_NAMES[weekday]][category] = total / counts[weekday, category]
 
         return weekday_averages
 
+    @_memoized
     def get_monthly_trends(self) -> Dict[str, Dict[str, float]]:
         """Get monthly trends for the past year"""
         daily_totals = self.get_daily_totals()
-        monthly_totals = defaultdict(lambda: defaultdict(float))
+        # Flat accumulator keyed by (month, category), pivoted at the end
+        totals = {}
 
         for date_str, day_data in daily_totals.items():
             month_key = date_str[:7]  # YYYY-MM
             for category, hours in day_data.items():
-                monthly_totals[month_key][category] += hours
+                key = (month_key, category)
+                totals[key] = totals.get(key, 0.0) + hours
+
+        monthly_totals = {}
+        for (month_key, category), hours in totals.items():
+            monthly_totals.setdefault(month_key, {})[category] = hours
+
+        return monthly_totals
+
+    @_memoized
+    def _scan_insights(self) -> Dict[str, Any]:
+        """Collect everything get_productivity_insights needs in one pass over the daily totals"""
+        daily_totals = self.get_daily_totals()
+        start_date, end_date = self.get_date_range()
+        recent_start = self.get_date_range(30)[0].isoformat()
+
+        tracked = [category for category in self.tracker.get_categories() if category != 'stop']
+        category_hours = dict.fromkeys(tracked, 0.0)
+        days_active = dict.fromkeys(tracked, 0)
+        weekday_sums = {}
+        weekday_counts = {}
+        recent_active_days = 0
+        streak = 0
+        in_streak = True
+
+        # Walk backwards from today so the streak is counted along the way
+        for date_str in reversed(_date_range_strs(start_date, (end_date - start_date).days + 1)):
+            day_data = daily_totals.get(date_str)
+            day_total = sum(day_data.values()) if day_data else 0
+
+            if in_streak:
+                if day_total > 0 and streak <= 100:
+                    streak += 1
+                else:
+                    in_streak = False
+
+            if not day_data:
+                continue
 
-        return dict(monthly_totals)
+            if day_total > 0 and date_str >= recent_start:
+                recent_active_days += 1
+
+            weekday = calendar.weekday(int(date_str[:4]), int(date_str[5:7]), int(date_str[8:10]))
+            for category, hours in day_data.items():
+                key = (weekday, category)
+                weekday_sums[key] = weekday_sums.get(key, 0.0) + hours
+                weekday_counts[key] = weekday_counts.get(key, 0) + 1
+
+                if category in category_hours:
+                    category_hours[category] += hours
+                    if hours > 0:
+                        days_active[category] += 1
+
+        # Average day per weekday = sum of its per-category averages
+        weekday_averages = [0.0] * 7
+        for (weekday, category), total in weekday_sums.items():
+            weekday_averages[weekday] += total / weekday_counts[weekday, category]
+
+        return {
+            'category_hours': category_hours,
+            'days_active': days_active,
+            'weekday_averages': weekday_averages,
+            'recent_active_days': recent_active_days,
+            'streak': streak
+        }
 
     def get_productivity_insights(self) -> List[str]:
         """Generate productivity insights based on data"""
         insights = []
-        category_stats = self.get_category_totals()
-        daily_totals = self.get_daily_totals(30)  # Last 30 days
-        weekly_patterns = self.get_weekly_patterns()
+        scan = self._scan_insights()
+        hours_by_category = scan['category_hours']
 
         # Total productivity
-        total_hours = sum(stats['total_hours'] for stats in category_stats.values())
+        total_hours = sum(hours_by_category.values())
         if total_hours > 0:
             insights.append(f"You've tracked {total_hours:.1f} total hours across all categories")
 
         # Most productive category
-        if category_stats:
-            top_category = max(category_stats.items(), key=lambda x: x[1]['total_hours'])
-            insights.append(f"Your most tracked activity is '{top_category[0]}' with {top_category[1]['total_hours']:.1f} hours")
+        if hours_by_category:
+            top_category = max(hours_by_category, key=hours_by_category.get)
+            insights.append(f"Your most tracked activity is '{top_category}' with {hours_by_category[top_category]:.1f} hours")
 
         # Recent activity
-        recent_days_with_data = len([d for d in daily_totals.values() if sum(d.values()) > 0])
+        recent_days_with_data = scan['recent_active_days']
         if recent_days_with_data > 0:
             insights.append(f"You've been active {recent_days_with_data} out of the last 30 days")
 
         # Best day of week
-        best_weekday = None
-        best_average = 0
-        for weekday, categories in weekly_patterns.items():
-            day_total = sum(categories.values())
-            if day_total > best_average:
-                best_average = day_total
-                best_weekday = weekday
+        weekday_averages = scan['weekday_averages']
+        best_index = max(range(7), key=weekday_averages.__getitem__)
+        best_average = weekday_averages[best_index]
 
-        if best_weekday and best_average > 0:
-            insights.append(f"Your most productive day is {best_weekday} (avg {best_average:.1f}h)")
+        if best_average > 0:
+            insights.append(f"Your most productive day is {WEEKDAY_NAMES[best_index]} (avg {best_average:.1f}h)")
 
         # Wasted time analysis
-        if 'wasted' in category_stats:
-            wasted_total = category_stats['wasted']['total_hours']
+        if 'wasted' in hours_by_category:
+            wasted_total = hours_by_category['wasted']
             if wasted_total > 0:
                 wasted_pct = (wasted_total / total_hours) * 100 if total_hours > 0 else 0
                 insights.append(f"You've tracked {wasted_total:.1f}h as 'wasted' ({wasted_pct:.1f}% of total time)")
 
         # Consistency
-        productive_categories = [cat for cat, stats in category_stats.items()
-                               if cat not in ['wasted', 'stop'] and stats['total_hours'] > 0]
+        productive_categories = [cat for cat, hours in hours_by_category.items()
+                               if cat not in ['wasted', 'stop'] and hours > 0]
         if productive_categories:
-            avg_days_active = sum(category_stats[cat]['days_active'] for cat in productive_categories) / len(productive_categories)
+            avg_days_active = sum(scan['days_active'][cat] for cat in productive_categories) / len(productive_categories)
             insights.append(f"You're consistent! Average {avg_days_active:.1f} active days per category")
 
         # Current streak
-        available_dates = sorted(self.tracker.list_available_dates())
-        if available_dates:
-            current_streak = 0
-            today = datetime.now().strftime('%Y-%m-%d')
-
-            # Check backwards from today
-            current_date = datetime.now()
-            while True:
-                date_str = current_date.strftime('%Y-%m-%d')
-                daily_stats = self.tracker.get_daily_stats(date_str)
-
-                if sum(daily_stats.values()) > 0:
-                    current_streak += 1
-                    current_date -= timedelta(days=1)
-                else:
-                    break
-
-                # Don't go back too far
-                if current_streak > 100:
-                    break
-
-            if current_streak > 0:
-                insights.append(f"Current activity streak: {current_streak} days!")
+        current_streak = scan['streak']
+        if current_streak > 0:
+            insights.append(f"Current activity streak: {current_streak} days!")
 
         return insights
 
     def get_time_distribution(self) -> Dict[str, float]:
         """Get percentage distribution of time across categories"""
-        category_stats = self.get_category_totals()
-        total_hours = sum(stats['total_hours'] for stats in category_stats.values())
+        hours = {category: stats['total_hours'] for category, stats in self.get_category_totals().items()}
+        total_hours = sum(hours.values())
 
         if total_hours == 0:
             return {}
 
-        distribution = {}
-        for category, stats in category_stats.items():
-            percentage = (stats['total_hours'] / total_hours) * 100
-            distribution[category] = percentage
-
-        return distribution
+        scale = 100.0 / total_hours
+        return {category: category_hours * scale for category, category_hours in hours.items()}
 
 # Compatibility wrapper
 class StatsAnalyzer(DailyStatsAnalyzer):
@@ -1,13 +1,50 @@
 import tkinter as tk
-from tkinter import font
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 import math
+import threading
+import calendar as cal
+from contextlib import contextmanager
 from typing import Dict, List, Any
 
 from tracker_daily import TimeTracker
-from stats_analyzer_daily import StatsAnalyzer
+from gui import _font
+from stats_analyzer_daily import WEEKDAY_NAMES, CalendarDay, StatsAnalyzer
+
+# Shared read-only stand-in for days without data
+_EMPTY = {}
+
+def _last_n_dates(n: int) -> List[date]:
+    """Get the last n local dates, oldest first and ending today"""
+    today = datetime.now().date()
+    return [today - timedelta(days=i) for i in range(n - 1, -1, -1)]
 
 class MinimalStatsWindow:
+    # 10-day trend graph layout
+    GRAPH_WIDTH = 450
+    GRAPH_HEIGHT = 200
+    GRAPH_MARGIN = 40
+    GRAPH_LEGEND_WIDTH = 100
+    GRAPH_DAYS = 10
+
+    # Month calendar canvas layout
+    CELL_WIDTH = 65
+    CELL_GAP = 4
+    ROW_GAP = 6
+    CALENDAR_HEADER_HEIGHT = 30
+    SEGMENT_BAR_WIDTH = 44
+
+    # Hover time before a calendar tooltip appears
+    TOOLTIP_DELAY_MS = 500
+
+    # Shorter category names for the calendar cells
+    _SHORT_NAMES = {
+        'programming': 'prg',
+        'Asset Creation': 'ast',
+        'Math': 'mth',
+        'wasted': 'wst',
+        'stop': 'stp'
+    }
+
     def __init__(self, tracker: TimeTracker):
         self.tracker = tracker
         self.analyzer = StatsAnalyzer(tracker)
@@ -27,7 +64,23 @@ class MinimalStatsWindow:
             'stop': '#696969'             # Dim gray
         }
 
+        # Past days never change, so their stats are fetched once per window
+        self._daily_cache = {}
+        # Persistent canvas items of the trend graph, built on first draw
+        self._graph_items = None
+        # Recycled calendar day cells, built on first load
+        self._day_cells = None
+        # Single tooltip window shared by all calendar cells, created on first hover
+        self._tooltip = None
+        # Cell the tooltip is shown (or pending) for, and the pending delayed show
+        self._tooltip_cell = None
+        self._tooltip_after = None
+
+        # Warm the analyzer and daily caches on a worker thread while the widgets are built
+        prefetch_thread = threading.Thread(target=self._prefetch_data, daemon=True)
+        prefetch_thread.start()
         self._create_widgets()
+        prefetch_thread.join()
         self._load_data()
 
     def _create_widgets(self):
@@ -36,7 +89,7 @@ class MinimalStatsWindow:
         title_label = tk.Label(
             self.root,
             text="Activity Overview",
-            font=font.Font(family="Segoe UI", size=18, weight="bold"),
+            font=_font(self.root, "Segoe UI", 18, "bold"),
             bg='#2d2d2d',
             fg='#ffffff'
         )
@@ -72,7 +125,7 @@ class MinimalStatsWindow:
         tk.Label(
             stats_frame,
             text="Total Time Tracked",
-            font=font.Font(family="Segoe UI", size=12, weight="bold"),
+            font=_font(self.root, "Segoe UI", 12, "bold"),
             bg='#3d3d3d',
             fg='#ffffff'
         ).pack(pady=(15, 5))
@@ -80,7 +133,7 @@ class MinimalStatsWindow:
         self.total_time_label = tk.Label(
             stats_frame,
             text="0.0 hours",
-            font=font.Font(family="Segoe UI", size=24, weight="bold"),
+            font=_font(self.root, "Segoe UI", 24, "bold"),
             bg='#3d3d3d',
             fg='#4a9eff'
         )
@@ -94,7 +147,7 @@ class MinimalStatsWindow:
         tk.Label(
             graph_frame,
             text="10-Day Trend",
-            font=font.Font(family="Segoe UI", size=14, weight="bold"),
+            font=_font(self.root, "Segoe UI", 14, "bold"),
             bg='#3d3d3d',
             fg='#ffffff'
         ).pack(pady=(15, 10))
@@ -102,98 +155,121 @@ class MinimalStatsWindow:
         # Canvas for the graph
         self.graph_canvas = tk.Canvas(
             graph_frame,
-            width=450,
-            height=200,
+            width=self.GRAPH_WIDTH,
+            height=self.GRAPH_HEIGHT,
             bg='#2d2d2d',
             highlightthickness=0
         )
         self.graph_canvas.pack(pady=(0, 15))
 
+    def _get_daily_stats(self, date_str: str) -> Dict[str, float]:
+        """Get stats for a date, re-reading only today's (still changing) data"""
+        if date_str in self._daily_cache and date_str != datetime.now().strftime('%Y-%m-%d'):
+            return self._daily_cache[date_str]
+        stats = self.tracker.get_daily_stats(date_str)
+        self._daily_cache[date_str] = stats
+        return stats
+
+    def _build_line_graph(self):
+        """Create the graph items that persist across redraws (axes, ticks, label slots)"""
+        canvas = self.graph_canvas
+        margin = self.GRAPH_MARGIN
+        bottom = self.GRAPH_HEIGHT - margin
+        graph_width = self.GRAPH_WIDTH - 2 * margin - self.GRAPH_LEGEND_WIDTH
+        graph_height = self.GRAPH_HEIGHT - 2 * margin
+
+        # Axes (adjusted for legend space)
+        canvas.create_line(margin, margin, margin, bottom, fill='#666666', width=2)
+        canvas.create_line(margin, bottom, margin + graph_width, bottom, fill='#666666', width=2)
+
+        # Y-axis ticks; label text is filled in per draw
+        y_labels = []
+        for i in range(5):
+            y = bottom - (i * graph_height / 4)
+            y_labels.append(canvas.create_text(margin - 10, y, fill='#888888', anchor='e', font=_font(self.root, "Segoe UI", 8)))
+            canvas.create_line(margin - 5, y, margin, y, fill='#666666')
+
+        # X-axis date slots
+        x_positions = [margin + (i * graph_width / (self.GRAPH_DAYS - 1)) for i in range(self.GRAPH_DAYS)]
+        x_labels = [canvas.create_text(x, bottom + 15, fill='#888888', font=_font(self.root, "Segoe UI", 8)) for x in x_positions]
+
+        self._graph_items = {
+            'x_positions': x_positions,
+            'y_labels': y_labels,
+            'x_labels': x_labels,
+            'categories': {}  # category -> (tag, line, [points], legend rect, legend text)
+        }
+
     def _draw_line_graph(self):
         """Draw the 10-day trend line graph"""
-        self.graph_canvas.delete("all")
-
-        # Get data for past 10 days
-        daily_data = {}
-        for i in range(10):
-            date = datetime.now() - timedelta(days=i)
-            date_str = date.strftime('%Y-%m-%d')
-            daily_stats = self.analyzer.tracker.get_daily_stats(date_str)
-            daily_data[date_str] = daily_stats
-
-        # Reverse to have oldest first
-        dates = sorted(daily_data.keys())
-
-        # Canvas dimensions
-        canvas_width = 450
-        canvas_height = 200
-        margin = 40
-        legend_width = 100
-        graph_width = canvas_width - 2 * margin - legend_width
-        graph_height = canvas_height - 2 * margin
+        if self._graph_items is None:
+            self._build_line_graph()
+        canvas = self.graph_canvas
+        items = self._graph_items
 
-        # Find max hours for scaling
-        max_hours = 0
-        for date_data in daily_data.values():
-            day_total = sum(date_data.values())
-            max_hours = max(max_hours, day_total)
+        # Get data for past 10 days, oldest first, with the axis label for each
+        day_labels = [(day.isoformat(), day.strftime('%m/%d')) for day in _last_n_dates(self.GRAPH_DAYS)]
+        dates = [date_str for date_str, _ in day_labels]
+        daily_data = {date_str: self._get_daily_stats(date_str) for date_str in dates}
 
-        if max_hours == 0:
-            max_hours = 1  # Prevent division by zero
+        margin = self.GRAPH_MARGIN
+        bottom = self.GRAPH_HEIGHT - margin
+        graph_width = self.GRAPH_WIDTH - 2 * margin - self.GRAPH_LEGEND_WIDTH
+        graph_height = self.GRAPH_HEIGHT - 2 * margin
 
-        # Draw axes (adjusted for legend space)
-        graph_end_x = margin + graph_width
-        self.graph_canvas.create_line(margin, margin, margin, canvas_height - margin, fill='#666666', width=2)
-        self.graph_canvas.create_line(margin, canvas_height - margin, graph_end_x, canvas_height - margin, fill='#666666', width=2)
+        # Find max hours for scaling
+        max_hours = max(sum(date_data.values()) for date_data in daily_data.values()) or 1  # Prevent division by zero
+        y_scale = graph_height / max_hours
 
         # Y-axis labels (hours)
-        for i in range(5):
-            y = canvas_height - margin - (i * graph_height / 4)
-            hours = (i * max_hours / 4)
-            self.graph_canvas.create_text(margin - 10, y, text=f"{hours:.1f}h", fill='#888888', anchor='e', font=('Segoe UI', 8))
-            self.graph_canvas.create_line(margin - 5, y, margin, y, fill='#666666')
+        for i, label_id in enumerate(items['y_labels']):
+            canvas.itemconfig(label_id, text=f"{(i * max_hours / 4):.1f}h")
 
         # X-axis labels (dates)
-        for i, date in enumerate(dates):
-            x = margin + (i * graph_width / (len(dates) - 1)) if len(dates) > 1 else margin + graph_width / 2
-            day = datetime.strptime(date, '%Y-%m-%d').strftime('%m/%d')
-            self.graph_canvas.create_text(x, canvas_height - margin + 15, text=day, fill='#888888', font=('Segoe UI', 8))
-
-        # Draw lines for each category
-        categories = set()
-        for date_data in daily_data.values():
-            categories.update(date_data.keys())
-
-        for category in categories:
-            if category == 'stop':
-                continue
+        for label_id, (_, label) in zip(items['x_labels'], day_labels):
+            canvas.itemconfig(label_id, text=label)
+
+        # Categories to plot, in a stable order
+        categories = sorted({category for date_data in daily_data.values() for category in date_data} - {'stop'})
 
-            color = self.category_colors.get(category, '#4682B4')
-            points = []
+        legend_x = margin + graph_width + 20
+        legend_y = margin + 10
+        category_colors = self.category_colors
+        x_positions = items['x_positions']
 
-            for i, date in enumerate(dates):
-                x = margin + (i * graph_width / (len(dates) - 1)) if len(dates) > 1 else margin + graph_width / 2
-                hours = daily_data[date].get(category, 0)
-                y = canvas_height - margin - (hours / max_hours * graph_height)
-                points.extend([x, y])
+        for index, category in enumerate(categories):
+            color = category_colors.get(category, '#4682B4')
 
-                # Draw point
-                self.graph_canvas.create_oval(x-3, y-3, x+3, y+3, fill=color, outline=color)
+            if category not in items['categories']:
+                # First time this category appears: create its items once, under one shared tag
+                tag = f"category{len(items['categories'])}"
+                line_id = canvas.create_line(0, 0, 0, 0, fill=color, width=2, smooth=False, tags=tag)
+                point_ids = [canvas.create_oval(0, 0, 0, 0, fill=color, outline=color, tags=tag) for _ in dates]
+                rect_id = canvas.create_rectangle(0, 0, 0, 0, fill=color, outline=color, tags=tag)
+                text_id = canvas.create_text(0, 0, text=category, fill='#ffffff', anchor='w',
+                                             font=_font(self.root, "Segoe UI", 8), tags=tag)
+                items['categories'][category] = (tag, line_id, point_ids, rect_id, text_id)
 
-            # Draw line
-            if len(points) >= 4:  # Need at least 2 points
-                self.graph_canvas.create_line(points, fill=color, width=2, smooth=False)
+            tag, line_id, point_ids, rect_id, text_id = items['categories'][category]
 
-        # Legend (positioned to the right of the graph)
-        legend_x = graph_end_x + 20
-        legend_y = margin + 10
-        for i, category in enumerate(categories):
-            if category == 'stop':
-                continue
-            color = self.category_colors.get(category, '#4682B4')
-            y = legend_y + i * 20
-            self.graph_canvas.create_rectangle(legend_x, y, legend_x + 12, y + 12, fill=color, outline=color)
-            self.graph_canvas.create_text(legend_x + 16, y + 6, text=category, fill='#ffffff', anchor='w', font=('Segoe UI', 8))
+            ys = [bottom - daily_data[date_str].get(category, 0) * y_scale for date_str in dates]
+            for x, y, point_id in zip(x_positions, ys, point_ids):
+                canvas.coords(point_id, x-3, y-3, x+3, y+3)
+
+            # Flat x0, y0, x1, y1, ... sequence for the line, built in one pass
+            canvas.coords(line_id, *[coord for point in zip(x_positions, ys) for coord in point])
+
+            # Legend (positioned to the right of the graph)
+            y = legend_y + index * 20
+            canvas.coords(rect_id, legend_x, y, legend_x + 12, y + 12)
+            canvas.coords(text_id, legend_x + 16, y + 6)
+
+            canvas.itemconfig(tag, state='normal')
+
+        # Hide categories that dropped out of the window instead of deleting them
+        for category, (tag, *_) in items['categories'].items():
+            if category not in categories:
+                canvas.itemconfig(tag, state='hidden')
 
     def _create_recent_activity(self, parent):
         """Create recent activity breakdown by category"""
@@ -203,7 +279,7 @@ class MinimalStatsWindow:
         tk.Label(
             recent_frame,
             text="Last 7 Days",
-            font=font.Font(family="Segoe UI", size=14, weight="bold"),
+            font=_font(self.root, "Segoe UI", 14, "bold"),
             bg='#3d3d3d',
             fg='#ffffff'
         ).pack(pady=(15, 10))
@@ -225,7 +301,7 @@ class MinimalStatsWindow:
         self.prev_button = tk.Button(
             header_frame,
             text="←",
-            font=font.Font(family="Segoe UI", size=12, weight="bold"),
+            font=_font(self.root, "Segoe UI", 12, "bold"),
             bg='#4a9eff',
             fg='#ffffff',
             bd=0,
@@ -236,7 +312,7 @@ class MinimalStatsWindow:
         self.month_label = tk.Label(
             header_frame,
             text="Activity Calendar",
-            font=font.Font(family="Segoe UI", size=14, weight="bold"),
+            font=_font(self.root, "Segoe UI", 14, "bold"),
             bg='#3d3d3d',
             fg='#ffffff'
         )
@@ -245,7 +321,7 @@ class MinimalStatsWindow:
         self.next_button = tk.Button(
             header_frame,
             text="→",
-            font=font.Font(family="Segoe UI", size=12, weight="bold"),
+            font=_font(self.root, "Segoe UI", 12, "bold"),
             bg='#4a9eff',
             fg='#ffffff',
             bd=0,
@@ -260,7 +336,7 @@ class MinimalStatsWindow:
         legend_frame = tk.Frame(calendar_frame, bg='#3d3d3d')
         legend_frame.pack(pady=(0, 15))
 
-        tk.Label(legend_frame, text="Categories: ", bg='#3d3d3d', fg='#888888', font=("Segoe UI", 9)).pack(side=tk.LEFT, padx=(20, 10))
+        tk.Label(legend_frame, text="Categories: ", bg='#3d3d3d', fg='#888888', font=_font(self.root, "Segoe UI", 9)).pack(side=tk.LEFT, padx=(20, 10))
 
         # Category legend
         for category, color in self.category_colors.items():
@@ -271,7 +347,7 @@ class MinimalStatsWindow:
                 square = tk.Frame(cat_frame, width=10, height=10, bg=color, relief=tk.RAISED, bd=1)
                 square.pack(side=tk.LEFT, padx=(0, 3))
 
-                tk.Label(cat_frame, text=category, bg='#3d3d3d', fg='#888888', font=("Segoe UI", 8)).pack(side=tk.LEFT)
+                tk.Label(cat_frame, text=category, bg='#3d3d3d', fg='#888888', font=_font(self.root, "Segoe UI", 8)).pack(side=tk.LEFT)
 
     def _create_category_breakdown(self, parent):
         """Create category time breakdown"""
@@ -281,7 +357,7 @@ class MinimalStatsWindow:
         tk.Label(
             category_frame,
             text="Time by Category",
-            font=font.Font(family="Segoe UI", size=14, weight="bold"),
+            font=_font(self.root, "Segoe UI", 14, "bold"),
             bg='#3d3d3d',
             fg='#ffffff'
         ).pack(pady=(15, 10))
@@ -297,7 +373,7 @@ class MinimalStatsWindow:
         tk.Label(
             insights_frame,
             text="Insights",
-            font=font.Font(family="Segoe UI", size=14, weight="bold"),
+            font=_font(self.root, "Segoe UI", 14, "bold"),
             bg='#3d3d3d',
             fg='#ffffff'
         ).pack(pady=(15, 10))
@@ -305,6 +381,31 @@ class MinimalStatsWindow:
         self.insights_content = tk.Frame(insights_frame, bg='#3d3d3d')
         self.insights_content.pack(fill=tk.X, padx=20, pady=(0, 15))
 
+    @contextmanager
+    def _replaced_content(self, name):
+        """Build a section's new content frame unmapped, then swap it in and destroy the old subtree at once"""
+        old = getattr(self, name)
+        setattr(self, name, tk.Frame(old.master, bg=old.cget('bg')))
+        try:
+            yield
+        finally:
+            # Map the new frame in the old one's place before dropping the old one, so nothing flashes blank
+            getattr(self, name).pack(after=old, **old.pack_info())
+            old.destroy()
+
+    def _prefetch_data(self):
+        """Read everything the first _load_data needs, so the loaders hit warm caches"""
+        try:
+            for day in _last_n_dates(self.GRAPH_DAYS):
+                self._get_daily_stats(day.isoformat())
+            self.analyzer.get_daily_totals(7)
+            self.analyzer.get_productivity_calendar_by_date(datetime.now().day)  # Current month so far
+            self.analyzer.get_category_totals()
+            self.analyzer.get_time_distribution()
+            self.analyzer.get_productivity_insights()
+        except Exception as e:
+            print(f"Error prefetching stats: {e}")
+
     def _load_data(self):
         """Load and display all data"""
         self._load_quick_stats()
@@ -332,49 +433,13 @@ class MinimalStatsWindow:
 
     def _update_calendar(self):
         """Update calendar display for current month"""
-        # Clear existing calendar
-        for widget in self.calendar_content.winfo_children():
-            widget.destroy()
-
         # Update month label
         month_name = self.current_month.strftime('%B %Y')
         self.month_label.config(text=f"Activity Calendar - {month_name}")
 
-        # Load calendar for current month
+        # Refresh the recycled day cells for the current month
         self._load_calendar()
 
-    def _create_category_color_mix(self, categories_data):
-        """Create a mixed color representing category distribution"""
-        if not categories_data or sum(categories_data.values()) == 0:
-            return '#2d2d2d'  # Empty day color
-
-        total_hours = sum(categories_data.values())
-
-        # Calculate weighted average of colors
-        r, g, b = 0, 0, 0
-        for category, hours in categories_data.items():
-            if hours > 0 and category in self.category_colors:
-                color = self.category_colors[category]
-                # Convert hex to RGB
-                hex_color = color.lstrip('#')
-                cat_r = int(hex_color[0:2], 16)
-                cat_g = int(hex_color[2:4], 16)
-                cat_b = int(hex_color[4:6], 16)
-
-                # Weight by hours
-                weight = hours / total_hours
-                r += cat_r * weight
-                g += cat_g * weight
-                b += cat_b * weight
-
-        # Convert back to hex, with intensity based on total hours
-        intensity = min(1.0, total_hours / 4.0)  # Max intensity at 4 hours
-        r = int(r * intensity + 45 * (1 - intensity))  # Blend with dark background
-        g = int(g * intensity + 45 * (1 - intensity))
-        b = int(b * intensity + 45 * (1 - intensity))
-
-        return f"#{r:02x}{g:02x}{b:02x}"
-
     def _load_quick_stats(self):
         """Load total time"""
         category_stats = self.analyzer.get_category_totals()
@@ -385,422 +450,442 @@ class MinimalStatsWindow:
         """Load recent activity by category"""
         daily_totals = self.analyzer.get_daily_totals(7)
 
-        # Create day headers
-        header_frame = tk.Frame(self.recent_content, bg='#3d3d3d')
-        header_frame.pack(fill=tk.X, pady=(0, 10))
-
-        # Day labels - show actual dates
-        tk.Label(header_frame, text="", bg='#3d3d3d', width=12).pack(side=tk.LEFT)  # Category column
-        for i in range(7):
-            date = datetime.now() - timedelta(days=6-i)
-            day_text = f"{date.strftime('%a')}\n{date.day}"
-            tk.Label(
-                header_frame,
-                text=day_text,
-                font=("Segoe UI", 8, "bold"),
-                bg='#3d3d3d',
-                fg='#cccccc',
-                width=8,
-                justify=tk.CENTER
-            ).pack(side=tk.LEFT)
-
-        # Get all categories that have been used
-        all_categories = set()
-        for day_data in daily_totals.values():
-            all_categories.update(day_data.keys())
-
-        # Create rows for each category
-        for category in sorted(all_categories):
-            if category == 'stop':
-                continue
+        with self._replaced_content('recent_content'):
+            # Create day headers
+            header_frame = tk.Frame(self.recent_content, bg='#3d3d3d')
+            header_frame.pack(fill=tk.X, pady=(0, 10))
+
+            # Day labels - show actual dates (last 7 days ending with today)
+            days = _last_n_dates(7)
+            date_strs = [day.isoformat() for day in days]
+            tk.Label(header_frame, text="", bg='#3d3d3d', width=12).pack(side=tk.LEFT)  # Category column
+            for day in days:
+                day_text = f"{day.strftime('%a')}\n{day.day}"
+                tk.Label(
+                    header_frame,
+                    text=day_text,
+                    font=_font(self.root, "Segoe UI", 8, "bold"),
+                    bg='#3d3d3d',
+                    fg='#cccccc',
+                    width=8,
+                    justify=tk.CENTER
+                ).pack(side=tk.LEFT)
+
+            # Get all categories that have been used
+            all_categories = set()
+            for day_data in daily_totals.values():
+                all_categories.update(day_data.keys())
+
+            # Per-day data for the shown dates, looked up once for all category rows
+            week_data = [daily_totals.get(date_str, _EMPTY) for date_str in date_strs]
+
+            # Create rows for each category
+            for category in sorted(all_categories):
+                if category == 'stop':
+                    continue
 
-            cat_frame = tk.Frame(self.recent_content, bg='#3d3d3d')
-            cat_frame.pack(fill=tk.X, pady=2)
-
-            # Category name
-            cat_color = self.category_colors.get(category, '#4682B4')
-            tk.Label(
-                cat_frame,
-                text=category,
-                font=("Segoe UI", 10),
-                bg='#3d3d3d',
-                fg=cat_color,
-                width=12,
-                anchor='w'
-            ).pack(side=tk.LEFT)
-
-            # Daily values - show last 7 days ending with today
-            for i in range(7):
-                date = datetime.now() - timedelta(days=6-i)
-                date_str = date.strftime('%Y-%m-%d')
-                hours = daily_totals.get(date_str, {}).get(category, 0)
-
-                # Debug: print what we're showing
-                # print(f"Day {i}: {date.strftime('%A %Y-%m-%d')} -> {hours:.1f}h for {category}")
+                cat_frame = tk.Frame(self.recent_content, bg='#3d3d3d')
+                cat_frame.pack(fill=tk.X, pady=2)
 
+                # Category name
+                cat_color = self.category_colors.get(category, '#4682B4')
                 tk.Label(
                     cat_frame,
-                    text=f"{hours:.1f}h" if hours > 0 else "-",
-                    font=("Consolas", 9),
+                    text=category,
+                    font=_font(self.root, "Segoe UI", 10),
                     bg='#3d3d3d',
-                    fg='#ffffff' if hours > 0 else '#666666',
-                    width=8
+                    fg=cat_color,
+                    width=12,
+                    anchor='w'
                 ).pack(side=tk.LEFT)
 
-    def _load_calendar(self):
-        """Load monthly calendar with progress bar category distribution"""
-        import calendar as cal
+                # Daily values
+                for day_data in week_data:
+                    hours = day_data.get(category, 0)
+                    tk.Label(
+                        cat_frame,
+                        text=f"{hours:.1f}h" if hours > 0 else "-",
+                        font=_font(self.root, "Consolas", 9),
+                        bg='#3d3d3d',
+                        fg='#ffffff' if hours > 0 else '#666666',
+                        width=8
+                    ).pack(side=tk.LEFT)
+
+    def _build_calendar_cells(self):
+        """Create the month canvas with its header and a pool of items for the 6x7 day cells"""
+        self.month_canvas = tk.Canvas(
+            self.calendar_content,
+            width=7 * (self.CELL_WIDTH + self.CELL_GAP),
+            height=self.CALENDAR_HEADER_HEIGHT,
+            bg='#3d3d3d',
+            highlightthickness=0
+        )
+        self.month_canvas.pack(expand=True)
+        canvas = self.month_canvas
 
-        # Get calendar data with category segments
-        calendar_data = self.analyzer.get_productivity_calendar(365)
+        # Day headers
+        for column, day_name in enumerate(WEEKDAY_NAMES):
+            canvas.create_text(
+                self._cell_x(column) + self.CELL_WIDTH / 2,
+                self.CALENDAR_HEADER_HEIGHT / 2 - 5,
+                text=day_name[:3],
+                font=_font(self.root, "Segoe UI", 10, "bold"),
+                fill='#cccccc'
+            )
 
-        # Create lookup for calendar data by date
-        calendar_lookup = {item['date']: item for item in calendar_data}
+        # Every cell item carries the shared 'cell' tag (for hover) and its own tag (for hiding)
+        self._cell_by_item = {}
+        self._day_cells = []
+        for index in range(42):
+            tags = ('cell', f"cell{index}")
+            cell = {
+                'tags': tags,
+                'background': canvas.create_rectangle(0, 0, 0, 0, outline='', tags=tags),
+                'day_label': canvas.create_text(0, 0, anchor='n', tags=tags),
+                'segments': [],
+                'remaining': canvas.create_rectangle(0, 0, 0, 0, fill='#1d1d1d', outline='', tags=tags),
+                'text': canvas.create_text(0, 0, font=_font(self.root, "Consolas", 8), fill='#cccccc',
+                                           justify=tk.CENTER, tags=tags),
+                'tooltip': None
+            }
+            for item in (cell['background'], cell['day_label'], cell['remaining'], cell['text']):
+                self._cell_by_item[item] = cell
+            self._day_cells.append(cell)
+
+        canvas.tag_bind('cell', "<Enter>", self._on_cell_enter)
+        canvas.tag_bind('cell', "<Leave>", self._on_cell_leave)
+
+    def _cell_x(self, column):
+        """Left edge of a calendar column on the month canvas"""
+        return column * (self.CELL_WIDTH + self.CELL_GAP) + self.CELL_GAP // 2
 
-        # Create calendar grid
-        calendar_grid = tk.Frame(self.calendar_content, bg='#3d3d3d')
-        calendar_grid.pack(expand=True)
+    def _load_calendar(self):
+        """Load monthly calendar with progress bar category distribution"""
+        if self._day_cells is None:
+            self._build_calendar_cells()
+        # The cells are about to be refilled, so a tooltip for one of them would be stale
+        self._hide_tooltip()
 
-        # Day headers
-        days_header = tk.Frame(calendar_grid, bg='#3d3d3d')
-        days_header.pack(fill=tk.X, pady=(0, 10))
-
-        day_names = ['Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun']
-        for day_name in day_names:
-            tk.Label(
-                days_header,
-                text=day_name,
-                font=("Segoe UI", 10, "bold"),
-                bg='#3d3d3d',
-                fg='#cccccc',
-                width=8
-            ).pack(side=tk.LEFT, padx=2)
+        # Get calendar data with category segments, reaching back only as far as the shown month
+        days_back = max(0, (datetime.now() - self.current_month).days + 1)
+        calendar_lookup = self.analyzer.get_productivity_calendar_by_date(days_back)
 
         # Get calendar data for current month
         month_calendar = cal.monthcalendar(self.current_month.year, self.current_month.month)
 
-        # Create calendar rows
-        for week in month_calendar:
-            week_frame = tk.Frame(calendar_grid, bg='#3d3d3d')
-            week_frame.pack(fill=tk.X, pady=2)
+        y = self.CALENDAR_HEADER_HEIGHT
+        for row in range(6):
+            cells = self._day_cells[row * 7:(row + 1) * 7]
+            if row >= len(month_calendar):
+                # Week rows the month doesn't need
+                for cell in cells:
+                    self.month_canvas.itemconfig(cell['tags'][1], state='hidden')
+                    cell['tooltip'] = None
+                continue
 
-            for day_num in week:
+            day_infos = []
+            for day_num in month_calendar[row]:
                 if day_num == 0:
-                    # Empty day from previous/next month
-                    empty_frame = tk.Frame(week_frame, width=65, height=50, bg='#2d2d2d')
-                    empty_frame.pack(side=tk.LEFT, padx=2, pady=1)
-                    empty_frame.pack_propagate(False)
+                    day_infos.append(None)  # Empty day from previous/next month
                 else:
-                    # Actual day
                     date_str = f"{self.current_month.year:04d}-{self.current_month.month:02d}-{day_num:02d}"
-                    day_info = calendar_lookup.get(date_str, {
-                        'date': date_str,
-                        'total_hours': 0,
-                        'categories': {},
-                        'category_segments': []
-                    })
-
-                    # Create day container (increased size for text below)
-                    container_height = 85 if day_info['total_hours'] > 0 else 50
-                    container_width = 65
-                    # More transparent background
-                    container_bg = '#1a1a1a' if day_info['total_hours'] > 0 else '#252525'
-                    day_container = tk.Frame(week_frame, width=container_width, height=container_height, bg=container_bg, relief=tk.FLAT, bd=1)
-                    day_container.pack(side=tk.LEFT, padx=2, pady=1)
-                    day_container.pack_propagate(False)
-
-                    # Day number label
-                    day_label = tk.Label(
-                        day_container,
-                        text=str(day_num),
-                        font=("Segoe UI", 8, "bold" if day_info['total_hours'] > 0 else "normal"),
-                        bg=container_bg,
-                        fg='#ffffff' if day_info['total_hours'] > 0 else '#666666'
-                    )
-                    day_label.pack(pady=(2, 0))
-
-                    # Progress bar area
-                    progress_frame = tk.Frame(day_container, bg=container_bg, height=20)
-                    progress_frame.pack(fill=tk.X, padx=3, pady=(1, 0))
-                    progress_frame.pack_propagate(False)
-
-                    # Create progress bar segments
-                    if day_info['category_segments']:
-                        segments_frame = tk.Frame(progress_frame, bg=container_bg, height=20)
-                        segments_frame.pack(fill=tk.BOTH, expand=True)
-
-                        # Calculate segment widths (total width ~44px)
-                        total_width = 44
-                        current_x = 0
-
-                        for segment in day_info['category_segments']:
-                            category = segment['category']
-                            percentage = segment['percentage']
-                            segment_width = max(1, int((percentage / 100) * total_width))
-
-                            # Get category color
-                            color = self.category_colors.get(category, '#4682B4')
-
-                            # Create segment
-                            segment_frame = tk.Frame(
-                                segments_frame,
-                                width=segment_width,
-                                height=20,
-                                bg=color
-                            )
-                            segment_frame.place(x=current_x, y=0)
-                            segment_frame.pack_propagate(False)
-
-                            current_x += segment_width
-
-                        # Fill remaining space with dark background if needed
-                        if current_x < total_width:
-                            remaining_frame = tk.Frame(
-                                segments_frame,
-                                width=total_width - current_x,
-                                height=20,
-                                bg='#1d1d1d'
-                            )
-                            remaining_frame.place(x=current_x, y=0)
-
-                    # Shorthand category text below progress bar
-                    if day_info['total_hours'] > 0:
-                        text_frame = tk.Frame(day_container, bg=container_bg, height=25)
-                        text_frame.pack(fill=tk.X, padx=1, pady=(1, 2))
-                        text_frame.pack_propagate(False)
-
-                        # Create shorthand text - use line breaks for better fit
-                        shorthand_lines = []
-                        current_line = []
-                        current_length = 0
-
-                        for segment in day_info['category_segments']:
-                            cat = segment['category']
-                            hours = segment['hours']
-
-                            # Create shorter category names
-                            short_names = {
-                                'programming': 'prg',
-                                'Asset Creation': 'ast',
-                                'Math': 'mth',
-                                'wasted': 'wst',
-                                'stop': 'stp'
-                            }
-                            short_cat = short_names.get(cat, cat[:3])
-
-                            # Format time (show minutes if less than 1 hour)
-                            if hours >= 1:
-                                time_str = f"{hours:.1f}h"
-                            else:
-                                minutes = int(hours * 60)
-                                time_str = f"{minutes}m"
-
-                            part = f"{short_cat}:{time_str}"
-
-                            # Check if we need a new line (keep lines under 8 chars)
-                            if current_length + len(part) + 1 > 8 and current_line:
-                                shorthand_lines.append(" ".join(current_line))
-                                current_line = [part]
-                                current_length = len(part)
-                            else:
-                                current_line.append(part)
-                                current_length += len(part) + (1 if current_line else 0)
-
-                        if current_line:
-                            shorthand_lines.append(" ".join(current_line))
-
-                        # Limit to 2 lines max
-                        if len(shorthand_lines) > 2:
-                            shorthand_lines = shorthand_lines[:2]
-
-                        shorthand_text = "\n".join(shorthand_lines)
-
-                        tk.Label(
-                            text_frame,
-                            text=shorthand_text,
-                            font=("Consolas", 8),
-                            bg='#2d2d2d',
-                            fg='#cccccc',
-                            justify=tk.CENTER
-                        ).pack(expand=True)
-
-                    # Tooltip with detailed breakdown
-                    if day_info['total_hours'] > 0:
-                        tooltip_text = f"{date_str}: {day_info['total_hours']:.1f}h total\n"
-                        for segment in day_info['category_segments']:
-                            cat = segment['category']
-                            hours = segment['hours']
-                            pct = segment['percentage']
-                            tooltip_text += f"  {cat}: {hours:.1f}h ({pct:.1f}%)\n"
-                        tooltip_text = tooltip_text.strip()
-
-                        self._create_tooltip(day_container, tooltip_text)
-                        self._create_tooltip(day_label, tooltip_text)
-                        self._create_tooltip(progress_frame, tooltip_text)
+                    day_infos.append(calendar_lookup.get(date_str) or CalendarDay.empty(date_str))
+
+            # Rows grow to fit the text below the bar when any day in them has time
+            row_height = 85 if any(info and info.total_hours > 0 for info in day_infos) else 50
+
+            for column, (cell, day_num, day_info) in enumerate(zip(cells, month_calendar[row], day_infos)):
+                if day_info is None:
+                    self._clear_day_cell(cell, self._cell_x(column), y)
+                else:
+                    self._fill_day_cell(cell, self._cell_x(column), y, day_num, day_info)
+
+            y += row_height + self.ROW_GAP
+
+        self.month_canvas.configure(height=y)
+
+    def _clear_day_cell(self, cell, x, y):
+        """Draw a recycled cell as an empty slot from the previous/next month"""
+        canvas = self.month_canvas
+        canvas.itemconfig(cell['tags'][1], state='hidden')
+        canvas.coords(cell['background'], x, y, x + self.CELL_WIDTH, y + 50)
+        canvas.itemconfig(cell['background'], fill='#2d2d2d', state='normal')
+        cell['tooltip'] = None
+
+    def _fill_day_cell(self, cell, x, y, day_num, day_info):
+        """Draw a recycled cell showing one day's data"""
+        canvas = self.month_canvas
+        has_time = day_info.total_hours > 0
+        canvas.itemconfig(cell['tags'][1], state='hidden')
+
+        # Day container (taller when there is text below the bar)
+        container_bg = '#1a1a1a' if has_time else '#252525'
+        canvas.coords(cell['background'], x, y, x + self.CELL_WIDTH, y + (85 if has_time else 50))
+        canvas.itemconfig(cell['background'], fill=container_bg, state='normal')
+
+        # Day number label
+        canvas.coords(cell['day_label'], x + self.CELL_WIDTH / 2, y + 2)
+        canvas.itemconfig(
+            cell['day_label'],
+            text=str(day_num),
+            font=_font(self.root, "Segoe UI", 8, "bold" if has_time else "normal"),
+            fill='#ffffff' if has_time else '#666666',
+            state='normal'
+        )
+
+        # Progress bar segments (total width ~44px)
+        bar_x = x + 3
+        bar_y = y + 18
+        total_width = self.SEGMENT_BAR_WIDTH
+        current_x = 0
+        category_colors = self.category_colors
+
+        for index, segment in enumerate(day_info.category_segments):
+            segment_width = max(1, int((segment['percentage'] / 100) * total_width))
+
+            # Reuse a pooled segment rectangle, growing the pool when needed
+            if index == len(cell['segments']):
+                item = canvas.create_rectangle(0, 0, 0, 0, outline='', tags=cell['tags'])
+                cell['segments'].append(item)
+                self._cell_by_item[item] = cell
+            item = cell['segments'][index]
+            canvas.coords(item, bar_x + current_x, bar_y, bar_x + current_x + segment_width, bar_y + 20)
+            canvas.itemconfig(item, fill=category_colors.get(segment['category'], '#4682B4'), state='normal')
+
+            current_x += segment_width
+
+        # Fill remaining space with dark background if needed
+        if day_info.category_segments and current_x < total_width:
+            canvas.coords(cell['remaining'], bar_x + current_x, bar_y, bar_x + total_width, bar_y + 20)
+            canvas.itemconfig(cell['remaining'], state='normal')
+
+        if not has_time:
+            cell['tooltip'] = None
+            return
+
+        # Shorthand category text below progress bar (minutes when under an hour)
+        short_names = self._SHORT_NAMES
+        parts = [
+            f"{short_names.get(segment['category'], segment['category'][:3])}:"
+            + (f"{segment['hours']:.1f}h" if segment['hours'] >= 1 else f"{int(segment['hours'] * 60)}m")
+            for segment in day_info.category_segments
+        ]
+
+        # Wrap into at most 2 lines, keeping lines under 8 chars where parts allow
+        shorthand_lines = []
+        current_line = ''
+        for part in parts:
+            if current_line and len(current_line) + 1 + len(part) > 8:
+                shorthand_lines.append(current_line)
+                current_line = part
+                if len(shorthand_lines) == 2:
+                    break
+            else:
+                current_line = f"{current_line} {part}" if current_line else part
+        if current_line and len(shorthand_lines) < 2:
+            shorthand_lines.append(current_line)
+
+        canvas.coords(cell['text'], x + self.CELL_WIDTH / 2, bar_y + 33)
+        canvas.itemconfig(cell['text'], text="\n".join(shorthand_lines), state='normal')
+
+        # Tooltip with detailed breakdown
+        tooltip_lines = [f"{day_info.date}: {day_info.total_hours:.1f}h total"]
+        tooltip_lines.extend(
+            f"  {segment['category']}: {segment['hours']:.1f}h ({segment['percentage']:.1f}%)"
+            for segment in day_info.category_segments
+        )
+        cell['tooltip'] = "\n".join(tooltip_lines)
 
     def _load_category_breakdown(self):
         """Load category breakdown with visual bars"""
         category_stats = self.analyzer.get_category_totals()
         distribution = self.analyzer.get_time_distribution()
 
-        if not category_stats:
-            tk.Label(
-                self.category_content,
-                text="No data available",
-                font=("Segoe UI", 11),
-                bg='#3d3d3d',
-                fg='#888888'
-            ).pack()
-            return
+        with self._replaced_content('category_content'):
+            if not category_stats:
+                tk.Label(
+                    self.category_content,
+                    text="No data available",
+                    font=_font(self.root, "Segoe UI", 11),
+                    bg='#3d3d3d',
+                    fg='#888888'
+                ).pack()
+                return
 
-        # Sort categories by total hours
-        sorted_categories = sorted(category_stats.items(), key=lambda x: x[1]['total_hours'], reverse=True)
+            # Sort categories by total hours
+            sorted_categories = sorted(category_stats.items(), key=lambda x: x[1]['total_hours'], reverse=True)
 
-        for category, stats in sorted_categories:
-            if category == 'stop' or stats['total_hours'] == 0:
-                continue
+            for category, stats in sorted_categories:
+                if category == 'stop' or stats['total_hours'] == 0:
+                    continue
+
+                cat_frame = tk.Frame(self.category_content, bg='#3d3d3d')
+                cat_frame.pack(fill=tk.X, pady=5)
+
+                # Category info frame
+                info_frame = tk.Frame(cat_frame, bg='#3d3d3d')
+                info_frame.pack(fill=tk.X)
+
+                # Category name and color
+                cat_color = self.category_colors.get(category, '#4682B4')
+                color_square = tk.Frame(info_frame, width=12, height=12, bg=cat_color)
+                color_square.pack(side=tk.LEFT, padx=(0, 10), pady=6)
+                color_square.pack_propagate(False)
+
+                # Category details
+                details_frame = tk.Frame(info_frame, bg='#3d3d3d')
+                details_frame.pack(side=tk.LEFT, fill=tk.X, expand=True)
+
+                # Name and total hours
+                name_frame = tk.Frame(details_frame, bg='#3d3d3d')
+                name_frame.pack(fill=tk.X)
+
+                tk.Label(
+                    name_frame,
+                    text=category,
+                    font=_font(self.root, "Segoe UI", 12, "bold"),
+                    bg='#3d3d3d',
+                    fg='#ffffff',
+                    anchor='w'
+                ).pack(side=tk.LEFT)
+
+                tk.Label(
+                    name_frame,
+                    text=f"{stats['total_hours']:.1f}h",
+                    font=_font(self.root, "Segoe UI", 12),
+                    bg='#3d3d3d',
+                    fg='#4a9eff',
+                    anchor='e'
+                ).pack(side=tk.RIGHT)
+
+                # Percentage and average
+                stats_frame = tk.Frame(details_frame, bg='#3d3d3d')
+                stats_frame.pack(fill=tk.X)
+
+                percentage = distribution.get(category, 0)
+
+                # Percentage
+                tk.Label(
+                    stats_frame,
+                    text=f"{percentage:.1f}%",
+                    font=_font(self.root, "Segoe UI", 9),
+                    bg='#3d3d3d',
+                    fg='#888888',
+                    anchor='w'
+                ).pack(side=tk.LEFT)
 
-            cat_frame = tk.Frame(self.category_content, bg='#3d3d3d')
-            cat_frame.pack(fill=tk.X, pady=5)
-
-            # Category info frame
-            info_frame = tk.Frame(cat_frame, bg='#3d3d3d')
-            info_frame.pack(fill=tk.X)
-
-            # Category name and color
-            cat_color = self.category_colors.get(category, '#4682B4')
-            color_square = tk.Frame(info_frame, width=12, height=12, bg=cat_color)
-            color_square.pack(side=tk.LEFT, padx=(0, 10), pady=6)
-            color_square.pack_propagate(False)
-
-            # Category details
-            details_frame = tk.Frame(info_frame, bg='#3d3d3d')
-            details_frame.pack(side=tk.LEFT, fill=tk.X, expand=True)
-
-            # Name and total hours
-            name_frame = tk.Frame(details_frame, bg='#3d3d3d')
-            name_frame.pack(fill=tk.X)
-
-            tk.Label(
-                name_frame,
-                text=category,
-                font=("Segoe UI", 12, "bold"),
-                bg='#3d3d3d',
-                fg='#ffffff',
-                anchor='w'
-            ).pack(side=tk.LEFT)
-
-            tk.Label(
-                name_frame,
-                text=f"{stats['total_hours']:.1f}h",
-                font=("Segoe UI", 12),
-                bg='#3d3d3d',
-                fg='#4a9eff',
-                anchor='e'
-            ).pack(side=tk.RIGHT)
-
-            # Percentage and average
-            stats_frame = tk.Frame(details_frame, bg='#3d3d3d')
-            stats_frame.pack(fill=tk.X)
-
-            percentage = distribution.get(category, 0)
-
-            # Percentage
-            tk.Label(
-                stats_frame,
-                text=f"{percentage:.1f}%",
-                font=("Segoe UI", 9),
-                bg='#3d3d3d',
-                fg='#888888',
-                anchor='w'
-            ).pack(side=tk.LEFT)
-
-            # Separator
-            tk.Label(
-                stats_frame,
-                text=" • Avg: ",
-                font=("Segoe UI", 9),
-                bg='#3d3d3d',
-                fg='#888888'
-            ).pack(side=tk.LEFT)
-
-            # Average per day (highlighted)
-            tk.Label(
-                stats_frame,
-                text=f"{stats['average_per_day']:.1f}h/day",
-                font=("Segoe UI", 10, "bold"),
-                bg='#3d3d3d',
-                fg='#4a9eff',  # Bright blue to stand out
-                anchor='w'
-            ).pack(side=tk.LEFT)
+                # Separator
+                tk.Label(
+                    stats_frame,
+                    text=" • Avg: ",
+                    font=_font(self.root, "Segoe UI", 9),
+                    bg='#3d3d3d',
+                    fg='#888888'
+                ).pack(side=tk.LEFT)
+
+                # Average per day (highlighted)
+                tk.Label(
+                    stats_frame,
+                    text=f"{stats['average_per_day']:.1f}h/day",
+                    font=_font(self.root, "Segoe UI", 10, "bold"),
+                    bg='#3d3d3d',
+                    fg='#4a9eff',  # Bright blue to stand out
+                    anchor='w'
+                ).pack(side=tk.LEFT)
 
     def _load_insights(self):
         """Load productivity insights"""
         insights = self.analyzer.get_productivity_insights()
 
-        if not insights:
-            tk.Label(
-                self.insights_content,
-                text="Use TimeCreator more to get insights",
-                font=("Segoe UI", 11),
-                bg='#3d3d3d',
-                fg='#888888'
-            ).pack()
-            return
+        with self._replaced_content('insights_content'):
+            if not insights:
+                tk.Label(
+                    self.insights_content,
+                    text="Use TimeCreator more to get insights",
+                    font=_font(self.root, "Segoe UI", 11),
+                    bg='#3d3d3d',
+                    fg='#888888'
+                ).pack()
+                return
+
+            for insight in insights:
+                insight_frame = tk.Frame(self.insights_content, bg='#3d3d3d')
+                insight_frame.pack(fill=tk.X, pady=3)
+
+                # Bullet point
+                tk.Label(
+                    insight_frame,
+                    text="•",
+                    font=_font(self.root, "Segoe UI", 12),
+                    bg='#3d3d3d',
+                    fg='#4a9eff'
+                ).pack(side=tk.LEFT, padx=(0, 8))
 
-        for insight in insights:
-            insight_frame = tk.Frame(self.insights_content, bg='#3d3d3d')
-            insight_frame.pack(fill=tk.X, pady=3)
-
-            # Bullet point
-            tk.Label(
-                insight_frame,
-                text="•",
-                font=("Segoe UI", 12),
-                bg='#3d3d3d',
-                fg='#4a9eff'
-            ).pack(side=tk.LEFT, padx=(0, 8))
-
-            # Insight text
-            tk.Label(
-                insight_frame,
-                text=insight,
-                font=("Segoe UI", 11),
-                bg='#3d3d3d',
-                fg='#ffffff',
-                anchor='w',
-                justify=tk.LEFT,
-                wraplength=700
-            ).pack(side=tk.LEFT, fill=tk.X, expand=True)
-
-    def _create_tooltip(self, widget, text):
-        """Create a tooltip for a widget"""
-        def on_enter(event):
-            tooltip = tk.Toplevel()
-            tooltip.wm_overrideredirect(True)
-            tooltip.wm_geometry(f"+{event.x_root+10}+{event.y_root+10}")
-
-            label = tk.Label(
-                tooltip,
-                text=text,
+                # Insight text
+                tk.Label(
+                    insight_frame,
+                    text=insight,
+                    font=_font(self.root, "Segoe UI", 11),
+                    bg='#3d3d3d',
+                    fg='#ffffff',
+                    anchor='w',
+                    justify=tk.LEFT,
+                    wraplength=700
+                ).pack(side=tk.LEFT, fill=tk.X, expand=True)
+
+    def _on_cell_enter(self, event):
+        """Show the hovered calendar cell's tooltip (shared handler for every cell item)"""
+        current = self.month_canvas.find_withtag('current')
+        cell = self._cell_by_item.get(current[0]) if current else None
+        if cell is self._tooltip_cell:
+            return  # Moved between items of the same cell
+
+        self._hide_tooltip()
+        if cell and cell['tooltip']:
+            # Show after a short delay so sweeping across the calendar doesn't flash every tooltip
+            self._tooltip_cell = cell
+            self._tooltip_after = self.root.after(
+                self.TOOLTIP_DELAY_MS, self._show_tooltip, cell['tooltip'], event.x_root, event.y_root
+            )
+
+    def _on_cell_leave(self, event):
+        """Hide the tooltip once the pointer leaves the hovered cell"""
+        if self._tooltip_cell is not None:
+            canvas = self.month_canvas
+            x0, y0, x1, y1 = canvas.coords(self._tooltip_cell['background'])
+            if x0 <= canvas.canvasx(event.x) < x1 and y0 <= canvas.canvasy(event.y) < y1:
+                return
+        self._hide_tooltip()
+
+    def _show_tooltip(self, text, x_root, y_root):
+        """Show the window's single tooltip near the pointer"""
+        self._tooltip_after = None
+        if self._tooltip is None:
+            self._tooltip = tk.Toplevel(self.root)
+            self._tooltip.wm_overrideredirect(True)
+            self._tooltip_label = tk.Label(
+                self._tooltip,
                 background="#2d2d2d",
                 foreground="#ffffff",
                 relief="solid",
                 borderwidth=1,
-                font=("Segoe UI", 9),
+                font=_font(self.root, "Segoe UI", 9),
                 justify=tk.LEFT
             )
-            label.pack()
-
-            widget.tooltip = tooltip
+            self._tooltip_label.pack()
 
-        def on_leave(event):
-            if hasattr(widget, 'tooltip'):
-                widget.tooltip.destroy()
-                del widget.tooltip
+        self._tooltip_label.configure(text=text)
+        self._tooltip.wm_geometry(f"+{x_root+10}+{y_root+10}")
+        self._tooltip.deiconify()
 
-        widget.bind("<Enter>", on_enter)
-        widget.bind("<Leave>", on_leave)
+    def _hide_tooltip(self, event=None):
+        """Hide the tooltip (or cancel its pending show), keeping the window for reuse"""
+        if self._tooltip_after is not None:
+            self.root.after_cancel(self._tooltip_after)
+            self._tooltip_after = None
+        self._tooltip_cell = None
+        if self._tooltip is not None:
+            self._tooltip.withdraw()
 
 def show_minimal_stats_window(tracker: TimeTracker):
     """Show the minimal stats window"""
@@ -817,4 +902,5 @@ if __name__ == "__main__":
     # Test the minimal stats window
     from tracker_daily import TimeTracker
     tracker = TimeTracker()
+    tracker.hold_data_lock()
     show_minimal_stats_window(tracker)
\ No newline at end of file
@@ -1,51 +1,95 @@
 import tkinter as tk
 from tkinter import font
 import threading
-import time
+import functools
+import concurrent.futures
 from typing import Optional, Callable
 from tracker import TimeTracker
 from gui import show_category_picker
 
-try:
-    import pystray
-    from PIL import Image, ImageDraw, ImageFont
-    PYSTRAY_AVAILABLE = True
-except ImportError:
-    PYSTRAY_AVAILABLE = False
-    # Create dummy classes for type hints when pystray is not available
-    class Image:
-        @staticmethod
-        def new(*args, **kwargs):
-            return None
-    print("pystray not available, using fallback status display")
+# pystray and PIL are only needed for the tray icon, so they are imported on first use
+pystray = Image = ImageDraw = ImageFont = _FONT_OBJ = None
+
+@functools.cache
+def pystray_available() -> bool:
+    """Import pystray and PIL once; False when they are not installed"""
+    global pystray, Image, ImageDraw, ImageFont, _FONT_OBJ
+    try:
+        import pystray
+        from PIL import Image, ImageDraw, ImageFont
+    except ImportError:
+        print("pystray not available, using fallback status display")
+        return False
+
+    # Icon font, loaded once
+    try:
+        _FONT_OBJ = ImageFont.truetype("arial.ttf", 20)
+    except:
+        _FONT_OBJ = ImageFont.load_default()
+    return True
+
+ICON_SIZE = 64
+
+@functools.cache
+def _icon_background():
+    """Blank icon with the circle background, drawn once and copied for each icon"""
+    image = Image.new('RGBA', (ICON_SIZE, ICON_SIZE), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(image)
+
+    margin = 4
+    draw.ellipse([margin, margin, ICON_SIZE-margin, ICON_SIZE-margin],
+                fill=(70, 130, 180, 255), outline=(50, 110, 160, 255), width=2)
+    return image
+
+@functools.lru_cache(maxsize=64)
+def _render_icon(text: str):
+    """Render a simple text-based icon (cached, the result depends only on the text)"""
+    size = ICON_SIZE
+    image = _icon_background().copy()
+    draw = ImageDraw.Draw(image)
+
+    # Center text
+    bbox = draw.textbbox((0, 0), text, font=_FONT_OBJ)
+    text_width = bbox[2] - bbox[0]
+    text_height = bbox[3] - bbox[1]
+    x = (size - text_width) // 2
+    y = (size - text_height) // 2
+
+    draw.text((x, y), text, fill=(255, 255, 255, 255), font=_FONT_OBJ)
+    return image
 
 class StatusDisplay:
     def __init__(self, tracker: TimeTracker):
         self.tracker = tracker
         self.running = False
         self.update_thread = None
-
-        if PYSTRAY_AVAILABLE:
-            self.tray_icon = None
+        self._stop_event = threading.Event()
+        # Set by the tracker on session/category changes so the display refreshes right away
+        self._change_event = threading.Event()
+        self.tracker.add_listener(self._on_tracker_change)
+        # Last values pushed to the display, so unchanged updates are skipped
+        self._menu_categories = None
+        self._last_abbrev = None
+        self._last_status = None
+
+        self.tray_icon = None
+        self.status_window = None
+        if pystray_available():
             self._setup_tray()
         else:
-            self.status_window = None
             self._setup_window()
 
     def _setup_tray(self):
         """Setup system tray icon"""
         # Create a simple icon
         icon_image = self._create_icon()
+        self._last_abbrev = "TC"
+        # New icons are rendered on one worker so the update loop never waits on PIL
+        self._icon_pool = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix="tray-icon")
 
         # Create menu
-        menu = pystray.Menu(
-            pystray.MenuItem("Switch Category", self._show_picker),
-            pystray.MenuItem("---", None),
-            *[pystray.MenuItem(cat, lambda _, c=cat: self._switch_to_category(c))
-              for cat in self.tracker.get_categories()],
-            pystray.MenuItem("---", None),
-            pystray.MenuItem("Exit", self._exit)
-        )
+        self._menu_categories = self.tracker.get_categories()
+        menu = self._create_menu(self._menu_categories)
 
         self.tray_icon = pystray.Icon(
             "TimeCreator",
@@ -54,35 +98,23 @@ class StatusDisplay:
             menu
         )
 
+    def _create_menu(self, categories: tuple):
+        """Create the tray menu for the given categories"""
+        return pystray.Menu(
+            pystray.MenuItem("Switch Category", self._show_picker),
+            pystray.MenuItem("---", None),
+            *[pystray.MenuItem(cat, lambda _, c=cat: self._switch_to_category(c))
+              for cat in categories],
+            pystray.MenuItem("---", None),
+            pystray.MenuItem("Exit", self._exit)
+        )
+
     def _create_icon(self, text: str = "TC"):
         """Create a simple text-based icon"""
-        if not PYSTRAY_AVAILABLE:
+        if not pystray_available():
             return None
 
-        size = 64
-        image = Image.new('RGBA', (size, size), (0, 0, 0, 0))
-        draw = ImageDraw.Draw(image)
-
-        # Draw circle background
-        margin = 4
-        draw.ellipse([margin, margin, size-margin, size-margin],
-                    fill=(70, 130, 180, 255), outline=(50, 110, 160, 255), width=2)
-
-        # Draw text
-        try:
-            font_obj = ImageFont.truetype("arial.ttf", 20)
-        except:
-            font_obj = ImageFont.load_default()
-
-        # Center text
-        bbox = draw.textbbox((0, 0), text, font=font_obj)
-        text_width = bbox[2] - bbox[0]
-        text_height = bbox[3] - bbox[1]
-        x = (size - text_width) // 2
-        y = (size - text_height) // 2
-
-        draw.text((x, y), text, fill=(255, 255, 255, 255), font=font_obj)
-        return image
+        return _render_icon(text)
 
     def _setup_window(self):
         """Setup fallback status window"""
@@ -184,45 +216,79 @@ class StatusDisplay:
     def _update_status(self):
         """Update status display"""
         status_text, tooltip = self._get_status_text()
+        # Only push what changed since the last update
+        status_changed = (status_text, tooltip) != self._last_status
+        self._last_status = (status_text, tooltip)
 
-        if PYSTRAY_AVAILABLE and self.tray_icon:
-            # Update tray icon
+        tray = self.tray_icon
+        if pystray_available() and tray:
+            # Update tray icon with the category abbreviation
             current = self.tracker.get_current_session()
-            if current:
-                # Create icon with category abbreviation
-                abbrev = current['category'][:2].upper()
-                icon = self._create_icon(abbrev)
-            else:
-                icon = self._create_icon("TC")
-
-            self.tray_icon.icon = icon
-            self.tray_icon.title = tooltip
-
-            # Update menu
-            menu = pystray.Menu(
-                pystray.MenuItem("Switch Category", self._show_picker),
-                pystray.MenuItem("---", None),
-                *[pystray.MenuItem(cat, lambda _, c=cat: self._switch_to_category(c))
-                  for cat in self.tracker.get_categories()],
-                pystray.MenuItem("---", None),
-                pystray.MenuItem("Exit", self._exit)
-            )
-            self.tray_icon.menu = menu
-
-        elif self.status_window:
+            abbrev = current['category'][:2].upper() if current else "TC"
+            if abbrev != self._last_abbrev:
+                self._last_abbrev = abbrev
+                future = self._icon_pool.submit(self._create_icon, abbrev)
+                future.add_done_callback(lambda f: self._icon_done(abbrev, f))
+
+            if status_changed:
+                tray.title = tooltip
+
+            # Update menu when the categories changed
+            categories = self.tracker.get_categories()
+            if categories != self._menu_categories:
+                tray.menu = self._create_menu(categories)
+                self._menu_categories = categories
+
+        elif self.status_window and status_changed:
             # Update window
             self.status_label.config(text=status_text)
             self.status_window.title(tooltip)
 
+    def _icon_done(self, abbrev: str, future):
+        """Called on the icon worker once an icon is rendered"""
+        if future.exception():
+            print(f"Error rendering icon {abbrev}: {future.exception()}")
+        elif abbrev == self._last_abbrev:  # Skip icons a newer category already replaced
+            self.tray_icon.icon = future.result()
+
     def _update_loop(self):
-        """Background update loop"""
-        while self.running:
+        """Tray update loop, woken by tracker changes and once a minute for the HH:MM duration"""
+        delay = 60  # start() does the initial update itself
+        while True:
+            self._change_event.wait(delay)
+            if self._stop_event.is_set():
+                break
+            self._change_event.clear()
             try:
                 self._update_status()
-                time.sleep(30)  # Update every 30 seconds
+                delay = 60
             except Exception as e:
                 print(f"Error updating status: {e}")
-                time.sleep(5)
+                delay = 5
+
+    def _on_tracker_change(self):
+        """Tracker listener, run on whichever thread made the change: wake the tray loop or flag the window"""
+        # Only sets an Event: no Tk call is safe off the mainloop, so the fallback window polls it in _window_tick
+        self._change_event.set()
+
+    def _refresh_window(self):
+        """Update the fallback window (runs on the Tk mainloop)"""
+        self._change_event.clear()
+        try:
+            self._update_status()
+        except Exception as e:
+            print(f"Error updating status: {e}")
+
+    def _window_tick(self, since_refresh_ms: int = 0):
+        """Fallback window loop: refresh soon after a tracker change, and once a minute for the HH:MM duration"""
+        if not self.running:
+            return
+
+        since_refresh_ms += 1000
+        if self._change_event.is_set() or since_refresh_ms >= 60000:
+            self._refresh_window()
+            since_refresh_ms = 0
+        self.status_window.after(1000, self._window_tick, since_refresh_ms)
 
     def start(self):
         """Start the status display"""
@@ -231,7 +297,7 @@ class StatusDisplay:
 
         self.running = True
 
-        if PYSTRAY_AVAILABLE and self.tray_icon:
+        if pystray_available() and self.tray_icon:
             # Start update thread
             self.update_thread = threading.Thread(target=self._update_loop, daemon=True)
             self.update_thread.start()
@@ -242,12 +308,9 @@ class StatusDisplay:
             # Run tray icon (blocks)
             self.tray_icon.run()
         else:
-            # Start update thread for window
-            self.update_thread = threading.Thread(target=self._update_loop, daemon=True)
-            self.update_thread.start()
-
-            # Initial update
+            # Initial update, then keep updating from the Tk mainloop (Tk widgets are not thread-safe)
             self._update_status()
+            self.status_window.after(1000, self._window_tick)
 
             # Show window and start mainloop
             self.status_window.mainloop()
@@ -255,8 +318,11 @@ class StatusDisplay:
     def stop(self):
         """Stop the status display"""
         self.running = False
+        self._stop_event.set()
+        self._change_event.set()  # Wake the update loop so it exits
 
-        if PYSTRAY_AVAILABLE and self.tray_icon:
+        if pystray_available() and self.tray_icon:
+            self._icon_pool.shutdown(wait=False, cancel_futures=True)
             self.tray_icon.stop()
         elif self.status_window:
             self.status_window.quit()
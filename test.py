@@ -13,8 +13,10 @@ def test_basic_functionality():
 
     # Use test data file
     test_file = "test_data.json"
-    if os.path.exists(test_file):
-        os.remove(test_file)
+    test_sessions_file = "test_data_sessions.jsonl"
+    for path in (test_file, test_sessions_file):
+        if os.path.exists(path):
+            os.remove(path)
 
     tracker = TimeTracker(test_file)
 
@@ -27,6 +29,8 @@ def test_basic_functionality():
     # Test adding category
     assert tracker.add_category("testing") == True
     assert "testing" in tracker.get_categories()
+    assert tracker.has_category("testing")
+    assert not tracker.has_category("unknown")
     assert tracker.add_category("testing") == False  # Already exists
 
     # Test starting session
@@ -57,8 +61,16 @@ def test_basic_functionality():
     assert tracker.start_session("stop") == True
     assert tracker.get_current_session() is None
 
+    # Sessions survive a reload from the state file and session log
+    reloaded = TimeTracker(test_file)
+    assert reloaded.get_sessions() == tracker.get_sessions()
+    assert "testing" in reloaded.get_categories()
+    with open(test_file) as f:
+        assert "sessions" not in json.load(f)
+
     # Clean up
     os.remove(test_file)
+    os.remove(test_sessions_file)
     print("[OK] Basic functionality tests passed!")
 
 def test_gui_import():
@@ -1,54 +1,188 @@
+import bisect
 import json
 import os
-from datetime import datetime, timezone
-from typing import Optional, List, Dict, Any
+from collections import defaultdict
+from datetime import date, datetime, timedelta, timezone
+from operator import itemgetter
+from typing import Callable, Optional, List, Dict, Any, Tuple
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+def _loads(raw: bytes) -> Any:
+    """Parse UTF-8 JSON bytes, using orjson when it is installed"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+def _dumps(obj: Any) -> bytes:
+    """Encode compact JSON as UTF-8 bytes, using orjson when it is installed"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode()
+
+def _next_date(date_str: str) -> str:
+    """Get the day after a YYYY-MM-DD date"""
+    return (date.fromisoformat(date_str) + timedelta(days=1)).isoformat()
 
 class TimeTracker:
+    # Days of completed sessions kept in memory; older ones are streamed from the log on demand
+    SESSION_WINDOW_DAYS = 90
+
     def __init__(self, data_file: str = "data.json"):
         self.data_file = data_file
+        # Completed sessions are appended here, so data_file only holds the small state
+        self.sessions_file = os.path.splitext(data_file)[0] + "_sessions.jsonl"
+        # First start date (YYYY-MM-DD) of the sessions held in self.data["sessions"]
+        self._window_start = (datetime.now(timezone.utc).date() - timedelta(days=self.SESSION_WINDOW_DAYS)).isoformat()
         self.data = self._load_data()
+        # Start timestamps parallel to self.data["sessions"] (chronological), for bisecting date ranges
+        self._session_starts = [session["start"] for session in self.data["sessions"]]
+        # Bumped whenever the category list changes so UIs can cache it
+        self.categories_version = 0
+        self._categories_set = set(self.data["categories"])
+        # Read-only snapshot handed out by get_categories, rebuilt when the list changes
+        self._categories_tuple = tuple(self.data["categories"])
+        # Callbacks run after sessions or categories change
+        self._listeners = []
+        # (start timestamp, parsed start datetime) of the current session, so it is parsed once
+        self._current_clock = None
+        # Completed sessions grouped by start date (YYYY-MM-DD), built on first daily stats query
+        self._sessions_by_day = None
 
     def _load_data(self) -> Dict[str, Any]:
-        """Load data from JSON file or create default structure"""
-        if os.path.exists(self.data_file):
-            try:
-                with open(self.data_file, 'r') as f:
-                    return json.load(f)
-            except (json.JSONDecodeError, FileNotFoundError):
-                pass
-
-        return {
-            "sessions": [],
-            "categories": ["programming", "wasted", "stop"],
-            "current": None
-        }
+        """Load state and session log, or create default structure"""
+        data = None
+        try:
+            with open(self.data_file, 'rb') as f:
+                data = _loads(f.read())
+        except (ValueError, FileNotFoundError):
+            pass
+
+        if data is None:
+            data = {
+                "categories": ["programming", "wasted", "stop"],
+                "current": None
+            }
+
+        legacy_sessions = data.pop("sessions", None)
+        if legacy_sessions:
+            # Old single-file data.json (possibly written by an older copy after the log existed):
+            # merge the sessions the log doesn't have yet into it, keeping it oldest first
+            logged = list(self._iter_logged_sessions())
+            logged_starts = {session["start"] for session in logged}
+            missing = [session for session in legacy_sessions if session["start"] not in logged_starts]
+            if missing:
+                self._write_sessions(sorted(logged + missing, key=itemgetter("start")))
+                print(f"Moved {len(missing)} sessions from {self.data_file} into {self.sessions_file}")
+            self._write_state(data)
+
+        data["sessions"] = self._recent_sessions(self._iter_logged_sessions())
+        return data
+
+    def _recent_sessions(self, sessions) -> List[Dict[str, Any]]:
+        """Keep the sessions that fall inside the in-memory window, sorted by start"""
+        window_start = self._window_start
+        recent = [session for session in sessions if session["start"][:10] >= window_start]
+        # _session_starts is bisected, so imported or hand-edited out-of-order sessions are sorted here
+        recent.sort(key=itemgetter("start"))
+        return recent
+
+    def _iter_logged_sessions(self):
+        """Stream all completed sessions from the append-only log, oldest first"""
+        try:
+            f = open(self.sessions_file, 'rb')
+        except FileNotFoundError:
+            return
+        with f:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    yield _loads(line)
+                except ValueError:
+                    print(f"Skipping unreadable session entry in {self.sessions_file}")
+
+    def _write_sessions(self, sessions: List[Dict[str, Any]]) -> None:
+        """Rewrite the whole session log (atomically, like the state file)"""
+        tmp_file = self.sessions_file + ".tmp"
+        with open(tmp_file, 'wb', buffering=65536) as f:
+            for session in sessions:
+                f.write(_dumps(session) + b"\n")
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_file, self.sessions_file)
+
+    def _append_session(self, session: Dict[str, Any]) -> None:
+        """Append one completed session to the log"""
+        with open(self.sessions_file, 'ab') as f:
+            f.write(_dumps(session) + b"\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+    def _write_state(self, data: Dict[str, Any]) -> None:
+        """Write categories and current session (everything except the sessions) to JSON file"""
+        state = {key: value for key, value in data.items() if key != "sessions"}
+        # Write compact JSON to a temp file and swap it in, so a crash never leaves a truncated file
+        tmp_file = self.data_file + ".tmp"
+        with open(tmp_file, 'wb', buffering=65536) as f:
+            f.write(_dumps(state))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_file, self.data_file)
 
     def _save_data(self) -> None:
-        """Save data to JSON file"""
-        with open(self.data_file, 'w') as f:
-            json.dump(self.data, f, indent=2)
+        """Save state to JSON file (sessions are appended to their log as they complete)"""
+        self._write_state(self.data)
+
+    def add_listener(self, callback: Callable[[], None]) -> None:
+        """Register a callback to run whenever sessions or categories change"""
+        self._listeners.append(callback)
+
+    def _notify(self) -> None:
+        """Run the registered change callbacks"""
+        for callback in self._listeners:
+            try:
+                callback()
+            except Exception as e:
+                print(f"Error in change listener: {e}")
 
     def _get_timestamp(self) -> str:
         """Get current timestamp in ISO format"""
         return datetime.now(timezone.utc).isoformat()
 
-    def get_categories(self) -> List[str]:
+    def get_categories(self) -> Tuple[str, ...]:
         """Get available categories"""
-        return self.data["categories"]
+        return self._categories_tuple
+
+    def has_category(self, category: str) -> bool:
+        """Check whether a category exists"""
+        return category in self._categories_set
 
     def add_category(self, category: str) -> bool:
         """Add a new category"""
-        if category not in self.data["categories"]:
+        if category not in self._categories_set:
             self.data["categories"].append(category)
+            self._categories_set.add(category)
+            self._categories_tuple = tuple(self.data["categories"])
+            self.categories_version += 1
             self._save_data()
+            self._notify()
             return True
         return False
 
     def remove_category(self, category: str) -> bool:
         """Remove a category"""
-        if category in self.data["categories"] and len(self.data["categories"]) > 1:
+        if category in self._categories_set and len(self.data["categories"]) > 1:
             self.data["categories"].remove(category)
+            self._categories_set.discard(category)
+            self._categories_tuple = tuple(self.data["categories"])
+            self.categories_version += 1
             self._save_data()
+            self._notify()
             return True
         return False
 
@@ -58,17 +192,18 @@ class TimeTracker:
 
     def start_session(self, category: str) -> bool:
         """Start a new session, stopping any current session"""
-        if category not in self.data["categories"]:
+        if category not in self._categories_set:
             return False
 
-        # Stop current session if exists
+        # Stop current session if exists (saved together with the new state below)
         if self.data["current"]:
-            self.stop_session()
+            self._stop_current_session()
 
         # Handle special 'stop' category
         if category == "stop":
             self.data["current"] = None
             self._save_data()
+            self._notify()
             return True
 
         # Start new session
@@ -78,13 +213,11 @@ class TimeTracker:
             "start": timestamp
         }
         self._save_data()
+        self._notify()
         return True
 
-    def stop_session(self) -> Optional[Dict[str, Any]]:
-        """Stop current session and save to history"""
-        if not self.data["current"]:
-            return None
-
+    def _stop_current_session(self) -> Dict[str, Any]:
+        """Move the current session into history without saving the state file"""
         current = self.data["current"]
         timestamp = self._get_timestamp()
 
@@ -96,18 +229,56 @@ class TimeTracker:
         }
 
         self.data["sessions"].append(completed_session)
+        self._session_starts.append(completed_session["start"])
+        self._append_session(completed_session)
+        if self._sessions_by_day is not None:
+            self._sessions_by_day[completed_session["start"][:10]].append(completed_session)
         self.data["current"] = None
+
+        return completed_session
+
+    def stop_session(self) -> Optional[Dict[str, Any]]:
+        """Stop current session and save to history"""
+        if not self.data["current"]:
+            return None
+
+        completed_session = self._stop_current_session()
         self._save_data()
+        self._notify()
 
         return completed_session
 
     def get_sessions(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
-        """Get session history"""
+        """Get session history (reads the log when more than the in-memory window is needed)"""
         sessions = self.data["sessions"]
+        if limit and limit <= len(sessions):
+            return sessions[-limit:]
+
+        sessions = list(self._iter_logged_sessions())
         if limit:
             return sessions[-limit:]
         return sessions
 
+    def get_sessions_range(self, start_date: str, end_date: str) -> List[Dict[str, Any]]:
+        """Get completed sessions that started between two dates (inclusive, YYYY-MM-DD)"""
+        if start_date >= self._window_start:
+            # ISO timestamps sort as strings, so the range is one slice of the chronological list
+            lo = bisect.bisect_left(self._session_starts, start_date)
+            hi = bisect.bisect_left(self._session_starts, _next_date(end_date))
+            return self.data["sessions"][lo:hi]
+
+        # Reaches past the in-memory window: stream the log
+        return [session for session in self._iter_logged_sessions()
+                if start_date <= session["start"][:10] <= end_date]
+
+    def _get_sessions_by_day(self) -> Dict[str, List[Dict[str, Any]]]:
+        """Get completed sessions grouped by start date, indexing them on first use"""
+        if self._sessions_by_day is None:
+            self._sessions_by_day = defaultdict(list)
+            for session in self.data["sessions"]:
+                self._sessions_by_day[session["start"][:10]].append(session)
+        return self._sessions_by_day
+
     def get_session_duration(self, session: Dict[str, Any]) -> Optional[float]:
         """Get duration of a session in seconds"""
         if "end" not in session or not session["end"]:
@@ -122,29 +293,38 @@ class TimeTracker:
         if not self.data["current"]:
             return None
 
-        start = datetime.fromisoformat(self.data["current"]["start"])
-        now = datetime.now(timezone.utc)
-        return (now - start).total_seconds()
+        # Wall clock, not time.monotonic(), which stops while the machine is suspended
+        start = self.data["current"]["start"]
+        if self._current_clock is None or self._current_clock[0] != start:
+            self._current_clock = (start, datetime.fromisoformat(start))
+        return (datetime.now(timezone.utc) - self._current_clock[1]).total_seconds()
 
     def get_daily_stats(self, date: Optional[str] = None) -> Dict[str, float]:
         """Get daily time statistics by category (in hours)"""
         if not date:
             date = datetime.now().strftime("%Y-%m-%d")
 
-        stats = {}
-        for session in self.data["sessions"]:
-            session_date = session["start"][:10]  # Extract YYYY-MM-DD
-            if session_date == date:
-                category = session["category"]
-                duration = self.get_session_duration(session)
-                if duration:
-                    stats[category] = stats.get(category, 0) + duration / 3600
+        if date >= self._window_start:
+            sessions = self._get_sessions_by_day().get(date, ())
+        else:
+            sessions = self.get_sessions_range(date, date)
+
+        seconds = defaultdict(float)
+        for session in sessions:
+            if not session.get("end"):
+                continue
+            start = datetime.fromisoformat(session["start"])
+            end = datetime.fromisoformat(session["end"])
+            duration = (end - start).total_seconds()
+            if duration:
+                seconds[session["category"]] += duration
 
-        return stats
+        # Convert to hours once per category rather than per session
+        return {category: total / 3600 for category, total in seconds.items()}
 
     def export_data(self) -> Dict[str, Any]:
         """Export all data for backup"""
-        return self.data.copy()
+        return {**self.data, "sessions": self.get_sessions()}
 
     def import_data(self, data: Dict[str, Any]) -> bool:
         """Import data from backup"""
@@ -152,8 +332,15 @@ class TimeTracker:
             # Validate data structure
             required_keys = ["sessions", "categories", "current"]
             if all(key in data for key in required_keys):
-                self.data = data
+                self.data = {**data, "sessions": self._recent_sessions(data["sessions"])}
+                self._categories_set = set(data["categories"])
+                self._categories_tuple = tuple(data["categories"])
+                self._session_starts = [session["start"] for session in self.data["sessions"]]
+                self._sessions_by_day = None
+                self.categories_version += 1
+                self._write_sessions(sorted(data["sessions"], key=itemgetter("start")))
                 self._save_data()
+                self._notify()
                 return True
         except Exception:
             pass
@@ -4,11 +4,120 @@ Daily file-based time tracker
 Stores data in individual JSON files per day for better organization
 """
 
+import concurrent.futures
 import json
 import os
-from datetime import datetime, timezone
-from typing import Optional, List, Dict, Any
+import sys
+import threading
+from datetime import date, datetime, timedelta, timezone
+from typing import Optional, List, Dict, Any, Tuple
 from pathlib import Path
+from collections import OrderedDict, defaultdict
+from contextlib import contextmanager
+from operator import itemgetter
+from types import MappingProxyType
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import fcntl
+    FCNTL_AVAILABLE = True
+except ImportError:  # Windows
+    import msvcrt
+    FCNTL_AVAILABLE = False
+
+# Parsed daily files kept in memory
+DAILY_CACHE_SIZE = 512
+# Parsed monthly rollups (YYYY/MM.json) kept in memory
+MONTH_CACHE_SIZE = 24
+
+# Shared read-only stand-in for days without a file; writers get a fresh dict from _new_daily_data
+_EMPTY_DAILY = MappingProxyType({"sessions": (), "total_by_category": MappingProxyType({})})
+
+def _loads(raw: bytes) -> Any:
+    """Parse UTF-8 JSON bytes, using orjson when it is installed"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+def _lock_file(f, exclusive: bool) -> bool:
+    """Lock an open file without waiting; False when another process holds a conflicting lock"""
+    try:
+        if FCNTL_AVAILABLE:
+            fcntl.flock(f.fileno(), (fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH) | fcntl.LOCK_NB)
+        else:
+            # msvcrt has no shared locks: the first tracker holds it exclusively and later ones run without it
+            f.seek(0)
+            msvcrt.locking(f.fileno(), msvcrt.LK_NBLCK, 1)
+    except OSError:
+        return False
+    return True
+
+def _read_json(path: Path) -> Any:
+    """Parse a JSON file"""
+    return _loads(path.read_bytes())
+
+def _dumps_line(obj: Any) -> bytes:
+    """Encode obj as one compact JSON line, using orjson when it is installed"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj) + b"\n"
+    return json.dumps(obj, separators=(",", ":")).encode() + b"\n"
+
+def _add_session(data: Dict[str, Any], session: Dict[str, Any]) -> None:
+    """Fold a completed session into a day's data"""
+    data["sessions"].append(session)
+    totals = data["total_by_category"]
+    totals[session["category"]] = totals.get(session["category"], 0) + session["duration"]
+
+def _write_json(path: Path, obj: Any, indent: bool = True) -> None:
+    """Atomically write obj as UTF-8 JSON (2-space indented unless indent is False), using orjson when installed"""
+    if ORJSON_AVAILABLE:
+        raw = orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    else:
+        raw = json.dumps(obj, indent=2 if indent else None, separators=None if indent else (",", ":")).encode()
+
+    # Write a sibling temp file and swap it in, so a crash never leaves a half-written file
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, 'wb') as f:
+        f.write(raw)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+def _fsync_dir(path: Path) -> None:
+    """Flush a directory's entries (e.g. a rename into it) to disk"""
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return  # Windows can't open directories; NTFS journals the rename itself
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+def _intern_totals(totals: Dict[str, float]) -> Dict[str, float]:
+    """Copy a seconds-by-category dict with interned category names"""
+    return {sys.intern(category): seconds for category, seconds in totals.items()}
+
+def _intern_categories(categories: List[str]) -> List[str]:
+    """Copy a category list with interned names"""
+    return [sys.intern(category) for category in categories]
+
+def _date_strs(start: date, end: date) -> List[str]:
+    """List the 'YYYY-MM-DD' strings from start to end (inclusive) via day ordinals rather than strftime"""
+    return [date.fromordinal(ordinal).isoformat() for ordinal in range(start.toordinal(), end.toordinal() + 1)]
+
+def _parse_timestamp(timestamp: str) -> datetime:
+    """Parse an ISO timestamp (ours never end in 'Z', older data may)"""
+    if timestamp.endswith('Z'):
+        timestamp = timestamp[:-1] + '+00:00'
+    return datetime.fromisoformat(timestamp)
 
 class DailyTracker:
     def __init__(self, data_dir: str = "data"):
@@ -18,6 +127,40 @@ class DailyTracker:
         # Global config file
         self.config_file = self.data_dir / "config.json"
         self.config = self._load_config()
+        # Category names are interned here and in the index, so totals lookups compare by identity
+        self.config["categories"] = _intern_categories(self.config["categories"])
+        # Bumped whenever the category list changes so UIs can cache it
+        self.categories_version = 0
+        self._categories_set = set(self.config["categories"])
+        # Read-only snapshot handed out by get_categories, rebuilt when the list changes
+        self._categories_tuple = tuple(self.config["categories"])
+        # Bumped on every daily file write so derived stats can be cached
+        self.data_version = 0
+
+        # Pre-aggregated seconds per category for every date with a daily file, loaded on first use
+        self.index_file = self.data_dir / "index.json"
+        self._index = None
+        # Exists while data files are written ahead of the index; left behind by a crash, it forces a rebuild
+        self.index_dirty_file = self.data_dir / "index.dirty"
+        # Guards every change to the index and the marker (session writes and stats reads run on different threads)
+        self._index_lock = threading.RLock()
+        # Set while the in-memory index holds sessions that index.json doesn't; flush_index writes it
+        self._index_unsaved = False
+        # Number of _index_pending blocks in progress; the marker must outlive all of them
+        self._index_writers = 0
+
+        # Recently read or written daily files, most recent last
+        self._daily_cache = OrderedDict()
+        self._daily_cache_lock = threading.Lock()  # Stats reads and session writes run on different threads
+        self._daily_files = {}
+        # Month directories known to exist, so saves only mkdir the first time
+        self._made_dirs = set()
+        # Days of recently used monthly rollups ("YYYY-MM" -> {"DD": daily data}), most recent last
+        self._month_cache = OrderedDict()
+
+        # Held shared by every open tracker (hold_data_lock) and exclusively by roll_up_past_months
+        self.data_lock_file = self.data_dir / "tracker.lock"
+        self._data_lock = None
 
         # Current session tracking
         self.current_session_file = self.data_dir / "current_session.json"
@@ -25,12 +168,11 @@ class DailyTracker:
 
     def _load_config(self) -> Dict[str, Any]:
         """Load global configuration"""
-        if self.config_file.exists():
-            try:
-                with open(self.config_file, 'r') as f:
-                    return json.load(f)
-            except (json.JSONDecodeError, FileNotFoundError):
-                pass
+        # Just open it: one syscall when the file exists, instead of a stat plus the open
+        try:
+            return _read_json(self.config_file)
+        except (json.JSONDecodeError, FileNotFoundError):
+            pass
 
         # Default config
         default_config = {
@@ -42,95 +184,296 @@ class DailyTracker:
 
     def _save_config(self, config: Dict[str, Any]) -> None:
         """Save global configuration"""
-        with open(self.config_file, 'w') as f:
-            json.dump(config, f, indent=2)
+        _write_json(self.config_file, config)
 
     def _load_current_session(self) -> Optional[Dict[str, Any]]:
         """Load current active session - but discard incomplete sessions on startup"""
-        if self.current_session_file.exists():
-            try:
-                with open(self.current_session_file, 'r') as f:
-                    session = json.load(f)
-
-                # If session doesn't have an end time, it's incomplete - discard it
-                if session and 'end' not in session:
-                    print(f"Discarding incomplete session: {session.get('category', 'unknown')}")
-                    self._save_current_session(None)  # Clear the incomplete session
-                    return None
-
-                return session
-            except (json.JSONDecodeError, FileNotFoundError):
-                pass
+        try:
+            session = _read_json(self.current_session_file)
+
+            # If session doesn't have an end time, it's incomplete - discard it
+            if session and 'end' not in session:
+                print(f"Discarding incomplete session: {session.get('category', 'unknown')}")
+                self._save_current_session(None)  # Clear the incomplete session
+                return None
+
+            return session
+        except (json.JSONDecodeError, FileNotFoundError):
+            pass
         return None
 
     def _save_current_session(self, session: Optional[Dict[str, Any]]) -> None:
         """Save current active session"""
         if session is None:
-            if self.current_session_file.exists():
-                self.current_session_file.unlink()
+            self.current_session_file.unlink(missing_ok=True)
         else:
-            with open(self.current_session_file, 'w') as f:
-                json.dump(session, f, indent=2)
+            _write_json(self.current_session_file, session)
 
     def _get_daily_file(self, date: str) -> Path:
-        """Get file path for a specific date (YYYY-MM-DD)"""
-        year, month, day = date.split('-')
-        year_dir = self.data_dir / year
-        year_dir.mkdir(exist_ok=True)
-
-        month_dir = year_dir / month
-        month_dir.mkdir(exist_ok=True)
-
-        return month_dir / f"{day}.json"
+        """Get file path for a specific date (YYYY-MM-DD), without creating its directory"""
+        daily_file = self._daily_files.get(date)
+        if daily_file is None:
+            year, month, day = date.split('-')
+            daily_file = self._daily_files[date] = self.data_dir / year / month / f"{day}.json"
+        return daily_file
+
+    def _get_session_log(self, date: str) -> Path:
+        """Get the append-only log of sessions completed on a date (YYYY/MM/DD.jsonl next to the daily file)"""
+        return self._get_daily_file(date).with_suffix(".jsonl")
+
+    def _ensure_dir(self, path: Path) -> None:
+        """Create a month directory the first time something is saved in it"""
+        if path not in self._made_dirs:
+            path.mkdir(parents=True, exist_ok=True)
+            self._made_dirs.add(path)
+
+    def _cache_daily_data(self, date: str, data: Dict[str, Any]) -> None:
+        """Remember a day's data, evicting the least recently used day past DAILY_CACHE_SIZE"""
+        with self._daily_cache_lock:
+            self._daily_cache[date] = data
+            self._daily_cache.move_to_end(date)
+            if len(self._daily_cache) > DAILY_CACHE_SIZE:
+                self._daily_cache.popitem(last=False)
+
+    def _load_month(self, year: str, month: str) -> Dict[str, Dict[str, Any]]:
+        """Get the days of a monthly rollup (empty when the month has none)"""
+        key = f"{year}-{month}"
+        with self._daily_cache_lock:
+            days = self._month_cache.get(key)
+            if days is not None:
+                self._month_cache.move_to_end(key)
+                return days
+
+        days = {}
+        month_file = self.data_dir / year / f"{month}.json"
+        try:
+            days = _read_json(month_file)["days"]
+        except FileNotFoundError:
+            pass
+        except (ValueError, KeyError):
+            print(f"Could not read monthly rollup {month_file}")
+        self._cache_month(key, days)
+        return days
+
+    def _cache_month(self, key: str, days: Dict[str, Dict[str, Any]]) -> None:
+        """Remember a monthly rollup's days, evicting the least recently used month past MONTH_CACHE_SIZE"""
+        with self._daily_cache_lock:
+            self._month_cache[key] = days
+            self._month_cache.move_to_end(key)
+            if len(self._month_cache) > MONTH_CACHE_SIZE:
+                self._month_cache.popitem(last=False)
+
+    def _load_daily_data(self, date: str, for_write: bool = False) -> Dict[str, Any]:
+        """Load data for a specific date (read-only _EMPTY_DAILY when it has no file, unless for_write)"""
+        with self._daily_cache_lock:
+            cached = self._daily_cache.get(date)
+            if cached is not None:
+                self._daily_cache.move_to_end(date)
+                return cached
 
-    def _load_daily_data(self, date: str) -> Dict[str, Any]:
-        """Load data for a specific date"""
         daily_file = self._get_daily_file(date)
+        data = None
 
-        if daily_file.exists():
-            try:
-                with open(daily_file, 'r') as f:
-                    return json.load(f)
-            except (json.JSONDecodeError, FileNotFoundError):
-                pass
+        try:
+            data = _read_json(daily_file)
+        except (json.JSONDecodeError, FileNotFoundError):
+            pass
+
+        if data is None:
+            day = self._load_month(date[:4], date[5:7]).get(date[8:])
+            if day is not None:
+                # Copy, so sessions folded in below leave the shared rollup alone
+                data = {**day, "sessions": list(day["sessions"]), "total_by_category": dict(day["total_by_category"])}
+
+        # Sessions appended to the day's log after the daily file was last written
+        replayed = self._replay_session_log(date, data)
+        if replayed is not None:
+            data = replayed
+        elif data is not None:
+            data.pop("log_offset", None)  # The log was folded into a monthly rollup and removed
+
+        if data is None:
+            return self._new_daily_data(date) if for_write else _EMPTY_DAILY
+        self._cache_daily_data(date, data)
+        return data
+
+    def _replay_session_log(self, date: str, data: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """Fold the day's log past data["log_offset"] into data (a new day when None); None when there is no log"""
+        session_log = self._get_session_log(date)
+        try:
+            f = open(session_log, 'rb')
+        except FileNotFoundError:
+            return None
 
-        # Default daily structure
+        if data is None:
+            data = self._new_daily_data(date)
+        with f:
+            f.seek(data.get("log_offset", 0))
+            for line in f:
+                if not line.endswith(b"\n"):  # Torn final write, not a complete entry
+                    break
+                data["log_offset"] = data.get("log_offset", 0) + len(line)
+                try:
+                    _add_session(data, _loads(line))
+                except (ValueError, KeyError):
+                    print(f"Skipping unreadable session entry in {session_log}")
+        return data
+
+    def _append_session(self, date: str, session: Dict[str, Any]) -> None:
+        """Append a completed session to the day's log and fold it into the cached data and the index"""
+        line = _dumps_line(session)
+
+        with self._index_lock:
+            index = self._get_index()  # Load (or rebuild) before the log changes, so the session isn't counted twice
+            # The index is written lazily (flush_index); until then the marker makes a crash rebuild it
+            if not self._index_unsaved:
+                self.index_dirty_file.touch()
+                self._index_unsaved = True
+
+            session_log = self._get_session_log(date)
+            self._ensure_dir(session_log.parent)
+            with open(session_log, 'ab') as f:
+                f.write(line)
+                f.flush()
+                os.fsync(f.fileno())  # The log line is the only durable record of the session until the index is flushed
+
+            with self._daily_cache_lock:
+                cached = self._daily_cache.get(date)
+            if cached is not None:
+                _add_session(cached, session)
+                cached["log_offset"] = cached.get("log_offset", 0) + len(line)
+
+            # Copy-on-write, like _update_index
+            index = dict(index)
+            totals = index[date] = dict(index.get(date, {}))
+            category = sys.intern(session["category"])
+            totals[category] = totals.get(category, 0) + session["duration"]
+            self._index = index
+            # Bumped only once the cache and index hold the session, so a reader that sees the new
+            # version (the analyzer's cache token) can't have computed from the old data
+            self.data_version += 1
+
+    def _new_daily_data(self, date: str) -> Dict[str, Any]:
+        """Create the structure for a day's first save"""
+        now = self._get_timestamp()
         return {
             "date": date,
             "sessions": [],
             "total_by_category": {},
-            "created": datetime.now(timezone.utc).isoformat(),
-            "modified": datetime.now(timezone.utc).isoformat()
+            "created": now,
+            "modified": now
         }
 
     def _save_daily_data(self, date: str, data: Dict[str, Any]) -> None:
-        """Save data for a specific date"""
-        data["modified"] = datetime.now(timezone.utc).isoformat()
+        """Save data for a specific date (the caller records it in the index with _update_index)"""
+        data["modified"] = self._get_timestamp()
         daily_file = self._get_daily_file(date)
-
-        with open(daily_file, 'w') as f:
-            json.dump(data, f, indent=2)
+        self._ensure_dir(daily_file.parent)
+
+        _write_json(daily_file, data)
+        self._cache_daily_data(date, data)
+
+    def _update_index(self, days: Dict[str, Dict[str, Any]]) -> None:
+        """Record the category totals of saved days (date -> daily data) in the index and write it (inside _index_pending)"""
+        # Copy-on-write, so readers iterating the current index are never disturbed
+        index = dict(self._get_index())
+        for date, data in days.items():
+            index[date] = _intern_totals(data["total_by_category"])
+        self._index = index
+        self.data_version += 1  # After the swap, as in _append_session
+        self._save_index()
+
+    @contextmanager
+    def _index_pending(self):
+        """Mark the index stale while data files are written ahead of it"""
+        with self._index_lock:
+            self._index_writers += 1
+            self.index_dirty_file.touch()
+            try:
+                yield
+            finally:
+                self._index_writers -= 1
+            # Only reached once the index is saved; after an exception the marker stays for the next load
+            if not self._index_unsaved and not self._index_writers:
+                self.index_dirty_file.unlink(missing_ok=True)
+
+    def flush_index(self) -> None:
+        """Write the index if sessions were recorded since it was last saved"""
+        with self._index_lock:
+            if not self._index_unsaved:
+                return
+            try:
+                self._save_index()
+            except OSError as e:
+                print(f"Error saving totals index: {e}")  # The marker stays, so the next load rebuilds it
+                return
+            self.index_dirty_file.unlink(missing_ok=True)
+
+    def _get_index(self) -> Dict[str, Dict[str, float]]:
+        """Get the per-date category totals (seconds), rebuilding the index file if it is missing or stale"""
+        if self._index is None:
+            with self._index_lock:
+                if self._index is None:
+                    if self.index_dirty_file.exists():
+                        print("Totals index was not saved after its last update, rebuilding it")
+                    else:
+                        try:
+                            self._index = {date_str: _intern_totals(totals)
+                                           for date_str, totals in _read_json(self.index_file).items()}
+                        except (ValueError, FileNotFoundError):
+                            pass
+                    if self._index is None:
+                        self.rebuild_index()
+        return self._index
+
+    def rebuild_index(self) -> None:
+        """Rebuild the per-date totals index by scanning every daily file"""
+        # Held throughout, so no session is appended while the pool refills the daily cache
+        with self._index_lock:
+            dates = self.list_available_dates()
+
+            # Overlap the file reads for long histories; short ones don't pay for the pool
+            if len(dates) > 60:
+                with concurrent.futures.ThreadPoolExecutor(max_workers=8) as pool:
+                    days = pool.map(self._load_daily_data, dates)
+                    self._index = {date_str: _intern_totals(data["total_by_category"]) for date_str, data in zip(dates, days)}
+            else:
+                self._index = {date_str: _intern_totals(self._load_daily_data(date_str)["total_by_category"])
+                               for date_str in dates}
+            self._save_index()
+            # A pending block (only ever this thread's, as the lock is held) clears the marker once its writes are indexed
+            if not self._index_writers:
+                self.index_dirty_file.unlink(missing_ok=True)
+
+    def _save_index(self) -> None:
+        """Write the per-date totals index (callers hold _index_lock)"""
+        _write_json(self.index_file, self._index, indent=False)
+        self._index_unsaved = False
+
+    def _now(self) -> datetime:
+        """Get the current time in UTC"""
+        return datetime.now(timezone.utc)
 
     def _get_timestamp(self) -> str:
         """Get current timestamp in ISO format"""
-        return datetime.now(timezone.utc).isoformat()
-
-    def _get_date_str(self, timestamp: str = None) -> str:
-        """Get date string (YYYY-MM-DD) from timestamp or current time"""
-        if timestamp:
-            dt = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
-        else:
-            dt = datetime.now(timezone.utc)
-        return dt.strftime('%Y-%m-%d')
+        return self._now().isoformat()
 
-    def get_categories(self) -> List[str]:
+    def get_categories(self) -> Tuple[str, ...]:
         """Get available categories"""
-        return self.config["categories"]
+        return self._categories_tuple
+
+    def has_category(self, category: str) -> bool:
+        """Check whether a category exists"""
+        return category in self._categories_set
 
     def add_category(self, category: str) -> bool:
         """Add a new category"""
         if category not in self.config["categories"]:
+            category = sys.intern(category)
             self.config["categories"].append(category)
+            self._categories_set.add(category)
+            self._categories_tuple = tuple(self.config["categories"])
+            self.categories_version += 1
             self._save_config(self.config)
             return True
         return False
@@ -139,6 +482,9 @@ class DailyTracker:
         """Remove a category"""
         if category in self.config["categories"] and len(self.config["categories"]) > 1:
             self.config["categories"].remove(category)
+            self._categories_set.discard(category)
+            self._categories_tuple = tuple(self.config["categories"])
+            self.categories_version += 1
             self._save_config(self.config)
             return True
         return False
@@ -148,7 +494,7 @@ class DailyTracker:
         return self.current_session
 
     def start_session(self, category: str) -> bool:
-        """Start a new session, stopping any current session"""
+        """Start a new session, stopping any current session (the running session is kept in memory only)"""
         if category not in self.config["categories"]:
             return False
 
@@ -168,7 +514,8 @@ class DailyTracker:
             "category": category,
             "start": timestamp
         }
-        self._save_current_session(self.current_session)
+        # Not written to current_session.json: _load_current_session discards a session without an end
+        # on startup, so a running session is lost on a crash either way and the write would be wasted
         return True
 
     def stop_session(self) -> Optional[Dict[str, Any]]:
@@ -177,28 +524,20 @@ class DailyTracker:
             return None
 
         current = self.current_session
-        timestamp = self._get_timestamp()
+        # Parse the start once and keep the end as a datetime until it is stored
+        start_dt = _parse_timestamp(current["start"])
+        end_dt = self._now()
 
         # Create completed session
         completed_session = {
             "category": current["category"],
             "start": current["start"],
-            "end": timestamp,
-            "duration": self._calculate_duration(current["start"], timestamp)
+            "end": end_dt.isoformat(),
+            "duration": (end_dt - start_dt).total_seconds()
         }
 
-        # Save to daily file
-        start_date = self._get_date_str(current["start"])
-        daily_data = self._load_daily_data(start_date)
-        daily_data["sessions"].append(completed_session)
-
-        # Update category totals
-        category = completed_session["category"]
-        if category not in daily_data["total_by_category"]:
-            daily_data["total_by_category"][category] = 0
-        daily_data["total_by_category"][category] += completed_session["duration"]
-
-        self._save_daily_data(start_date, daily_data)
+        # Append to the day's session log rather than rewriting its whole daily file
+        self._append_session(start_dt.strftime('%Y-%m-%d'), completed_session)
 
         # Clear current session
         self.current_session = None
@@ -208,23 +547,19 @@ class DailyTracker:
 
     def _calculate_duration(self, start_time: str, end_time: str) -> float:
         """Calculate duration between two timestamps in seconds"""
-        start = datetime.fromisoformat(start_time.replace('Z', '+00:00'))
-        end = datetime.fromisoformat(end_time.replace('Z', '+00:00'))
-        return (end - start).total_seconds()
+        return (_parse_timestamp(end_time) - _parse_timestamp(start_time)).total_seconds()
 
     def get_current_duration(self) -> Optional[float]:
         """Get duration of current session in seconds"""
         if not self.current_session:
             return None
 
-        start = datetime.fromisoformat(self.current_session["start"].replace('Z', '+00:00'))
-        now = datetime.now(timezone.utc)
-        return (now - start).total_seconds()
+        return (self._now() - _parse_timestamp(self.current_session["start"])).total_seconds()
 
     def get_daily_stats(self, date: str) -> Dict[str, float]:
         """Get statistics for a specific date (hours by category)"""
-        daily_data = self._load_daily_data(date)
-        return {cat: hours / 3600 for cat, hours in daily_data["total_by_category"].items()}
+        # Totals come from the index, so the day's sessions are never read or parsed
+        return {cat: seconds / 3600 for cat, seconds in self._get_index().get(date, {}).items()}
 
     def get_daily_sessions(self, date: str) -> List[Dict[str, Any]]:
         """Get all sessions for a specific date"""
@@ -233,26 +568,23 @@ class DailyTracker:
 
     def get_date_range_stats(self, start_date: str, end_date: str) -> Dict[str, Dict[str, float]]:
         """Get stats for a range of dates"""
-        from datetime import datetime, timedelta
-
-        start = datetime.strptime(start_date, '%Y-%m-%d')
-        end = datetime.strptime(end_date, '%Y-%m-%d')
+        index = self._get_index()
+        return {date_str: {cat: seconds / 3600 for cat, seconds in index.get(date_str, {}).items()}
+                for date_str in _date_strs(date.fromisoformat(start_date), date.fromisoformat(end_date))}
 
-        stats = {}
-        current = start
+    def _index_range(self, start_date: str, end_date: str) -> List[tuple]:
+        """Get (date, seconds by category) from the index for dates between start_date and end_date, in order"""
+        return sorted((date_str, totals) for date_str, totals in self._get_index().items()
+                      if start_date <= date_str <= end_date)
 
-        while current <= end:
-            date_str = current.strftime('%Y-%m-%d')
-            stats[date_str] = self.get_daily_stats(date_str)
-            current += timedelta(days=1)
-
-        return stats
+    def get_daily_stats_range(self, start_date: str, end_date: str) -> Dict[str, Dict[str, float]]:
+        """Get stats for the dates between start_date and end_date that have a daily file"""
+        return {date_str: {cat: seconds / 3600 for cat, seconds in totals.items()}
+                for date_str, totals in self._index_range(start_date, end_date)}
 
     def get_category_totals(self, days_back: int = 365) -> Dict[str, Dict[str, Any]]:
         """Get comprehensive stats per category for the last N days"""
-        from datetime import datetime, timedelta
-
-        end_date = datetime.now()
+        end_date = datetime.now().date()
         start_date = end_date - timedelta(days=days_back)
 
         category_stats = {}
@@ -267,80 +599,107 @@ class DailyTracker:
             }
 
         # Scan through date range
-        current = start_date
-        days_scanned = 0
-
-        while current <= end_date:
-            date_str = current.strftime('%Y-%m-%d')
-            daily_stats = self.get_daily_stats(date_str)
-            days_scanned += 1
-
-            for category, hours in daily_stats.items():
-                if category in category_stats:
-                    category_stats[category]['total_hours'] += hours
-                    if hours > 0:
-                        category_stats[category]['days_active'] += 1
-                        category_stats[category]['max_day_hours'] = max(
-                            category_stats[category]['max_day_hours'], hours
-                        )
-
-            current += timedelta(days=1)
-
-        # Calculate averages
-        for category in category_stats:
+        date_strs = _date_strs(start_date, end_date)
+        days_scanned = len(date_strs)
+        index = self._get_index()
+
+        # Flat [total seconds, active days, max day seconds] per category, converted to hours once at the end
+        sums = {category: [0, 0, 0] for category in category_stats}
+        for date_str in date_strs:
+            for category, seconds in index.get(date_str, {}).items():
+                acc = sums.get(category)
+                if acc is not None:
+                    acc[0] += seconds
+                    if seconds > 0:
+                        acc[1] += 1
+                        if seconds > acc[2]:
+                            acc[2] = seconds
+
+        # Calculate hours and averages
+        for category, (total, days_active, max_day) in sums.items():
+            stats = category_stats[category]
+            stats['total_hours'] = total / 3600
+            stats['days_active'] = days_active
+            stats['max_day_hours'] = max_day / 3600
             if days_scanned > 0:
-                category_stats[category]['average_per_day'] = (
-                    category_stats[category]['total_hours'] / days_scanned
-                )
+                stats['average_per_day'] = stats['total_hours'] / days_scanned
 
         return category_stats
 
+    def _iter_old_session_log(self, old_data_file: str):
+        """Stream the sessions tracker.py logged next to an old data file (data.json -> data_sessions.jsonl)"""
+        session_log = os.path.splitext(old_data_file)[0] + "_sessions.jsonl"
+        try:
+            f = open(session_log, 'rb')
+        except FileNotFoundError:
+            return
+        with f:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    yield _loads(line)
+                except ValueError:
+                    print(f"Skipping unreadable session entry in {session_log}")
+
     def migrate_from_old_format(self, old_data_file: str) -> bool:
         """Migrate data from old single-file format"""
-        if not os.path.exists(old_data_file):
-            return False
-
         try:
-            with open(old_data_file, 'r') as f:
-                old_data = json.load(f)
+            old_data = _read_json(Path(old_data_file))
 
             # Migrate categories
             if "categories" in old_data:
-                self.config["categories"] = old_data["categories"]
+                self.config["categories"] = _intern_categories(old_data["categories"])
+                self._categories_set = set(self.config["categories"])
+                self._categories_tuple = tuple(self.config["categories"])
+                self.categories_version += 1
                 self._save_config(self.config)
 
-            # Migrate sessions
-            if "sessions" in old_data:
-                sessions_by_date = {}
+            # Migrate sessions: those still in the old file plus tracker.py's <stem>_sessions.jsonl log
+            sessions = old_data.get("sessions") or []
+            starts = {session.get("start") for session in sessions}
+            for session in self._iter_old_session_log(old_data_file):
+                if session.get("start") not in starts:
+                    starts.add(session.get("start"))
+                    sessions.append(session)
+
+            if sessions:
+                sessions_by_date = defaultdict(list)
+                # Seconds per (date, category), summed in the same pass that groups the sessions
+                totals = defaultdict(float)
 
-                for session in old_data["sessions"]:
+                for session in sessions:
                     if "start" not in session or "end" not in session:
                         continue
 
-                    start_date = self._get_date_str(session["start"])
-
-                    if start_date not in sessions_by_date:
-                        sessions_by_date[start_date] = []
+                    # Parse each timestamp once for both the date and the duration
+                    start_dt = _parse_timestamp(session["start"])
+                    start_date = start_dt.strftime('%Y-%m-%d')
 
                     # Calculate duration
-                    duration = self._calculate_duration(session["start"], session["end"])
+                    duration = (_parse_timestamp(session["end"]) - start_dt).total_seconds()
                     session["duration"] = duration
 
                     sessions_by_date[start_date].append(session)
+                    key = (start_date, session["category"])
+                    totals[key] += duration
 
                 # Save to daily files
+                daily_by_date = {}
                 for date_str, sessions in sessions_by_date.items():
-                    daily_data = self._load_daily_data(date_str)
+                    daily_data = self._load_daily_data(date_str, for_write=True)
                     daily_data["sessions"] = sessions
+                    daily_by_date[date_str] = daily_data
 
-                    # Calculate totals
-                    for session in sessions:
-                        category = session["category"]
-                        if category not in daily_data["total_by_category"]:
-                            daily_data["total_by_category"][category] = 0
-                        daily_data["total_by_category"][category] += session["duration"]
+                for (date_str, category), seconds in totals.items():
+                    day_totals = daily_by_date[date_str]["total_by_category"]
+                    day_totals[category] = day_totals.get(category, 0) + seconds
 
-                    self._save_daily_data(date_str, daily_data)
+                self._get_index()  # Load before marking it stale
+                with self._index_pending():
+                    for date_str, daily_data in daily_by_date.items():
+                        self._save_daily_data(date_str, daily_data)
+                    self._update_index(daily_by_date)
 
             # Migrate current session
             if "current" in old_data and old_data["current"]:
@@ -349,10 +708,102 @@ class DailyTracker:
 
             return True
 
+        except FileNotFoundError:
+            return False
         except Exception as e:
             print(f"Migration failed: {e}")
             return False
 
+    def hold_data_lock(self) -> bool:
+        """Mark the data directory as in use until this process exits, so roll_up_past_months refuses to run"""
+        if self._data_lock is None:
+            f = open(self.data_lock_file, 'a+b')
+            if not _lock_file(f, exclusive=False):
+                f.close()
+                return False
+            self._data_lock = f  # Released by the OS when the process exits, even after a crash
+        return True
+
+    def roll_up_past_months(self) -> List[str]:
+        """Consolidate the daily files of every month before the current one; returns the months rolled up"""
+        # It deletes files a running tracker may have cached, so it only runs while no other tracker has
+        # the directory open and this one is neither tracking nor writing
+        if self.current_session:
+            print("A session is running; stop it before rolling up")
+            return []
+        if not self._index_lock.acquire(blocking=False):
+            print("The totals index is being updated; try the rollup again")
+            return []
+        try:
+            with open(self.data_lock_file, 'a+b') as lock:
+                if not _lock_file(lock, exclusive=True):
+                    print("Another tracker has the data directory open; close it before rolling up")
+                    return []
+                return self._roll_up_past_months()
+        finally:
+            self._index_lock.release()
+
+    def _roll_up_past_months(self) -> List[str]:
+        """Consolidate every past month (the caller holds the data and index locks)"""
+        current_month = self._now().strftime('%Y-%m')
+        past_months = []
+        with os.scandir(self.data_dir) as years:
+            for year in years:
+                if len(year.name) != 4 or not year.name.isdigit() or not year.is_dir(follow_symlinks=False):
+                    continue
+                with os.scandir(year.path) as months:
+                    past_months.extend((year.name, month.name) for month in months
+                                       if len(month.name) == 2 and month.name.isdigit()
+                                       and month.is_dir(follow_symlinks=False)
+                                       and f"{year.name}-{month.name}" < current_month)
+
+        rolled_up = []
+        for year, month in sorted(past_months):
+            try:
+                if self._consolidate_month(year, month):
+                    rolled_up.append(f"{year}-{month}")
+            except OSError as e:
+                print(f"Could not roll up {year}-{month}: {e}")
+        return rolled_up
+
+    def _consolidate_month(self, year: str, month: str) -> bool:
+        """Fold a month's daily files and session logs into one YYYY/MM.json rollup and remove them"""
+        month_dir = self.data_dir / year / month
+        with os.scandir(month_dir) as entries:
+            day_names = sorted({entry.name[:2] for entry in entries
+                                if entry.name[2:] in ('.json', '.jsonl') and entry.name[:2].isdigit()})
+
+        days = dict(self._load_month(year, month))
+        rolled_up = []
+        for day in day_names:
+            data = self._load_daily_data(f"{year}-{month}-{day}")
+            if data is not _EMPTY_DAILY:  # Unreadable files stay where they are
+                data.pop("log_offset", None)  # The rollup holds the whole log, which is removed below
+                days[day] = data
+                rolled_up.append(day)
+
+        if rolled_up:
+            _write_json(self.data_dir / year / f"{month}.json", {"days": days})
+            _fsync_dir(self.data_dir / year)  # The rollup must be on disk before its sources are deleted
+            self._cache_month(f"{year}-{month}", days)
+
+            # Logs first: a daily file left behind without its log drops its log_offset on load
+            for day in rolled_up:
+                date = f"{year}-{month}-{day}"
+                self._get_session_log(date).unlink(missing_ok=True)
+                self._get_daily_file(date).unlink(missing_ok=True)
+
+        # Forget the month's paths, so a later save recreates the directory instead of assuming it exists
+        prefix = f"{year}-{month}-"
+        for date in [date for date in self._daily_files if date.startswith(prefix)]:
+            del self._daily_files[date]
+        try:
+            month_dir.rmdir()
+            self._made_dirs.discard(month_dir)
+        except OSError:
+            pass  # Something besides daily files is left in it
+        return bool(rolled_up)
+
     def list_available_dates(self) -> List[str]:
         """List all dates that have data"""
         dates = []
@@ -360,20 +811,30 @@ class DailyTracker:
         if not self.data_dir.exists():
             return dates
 
-        for year_dir in self.data_dir.iterdir():
-            if not year_dir.is_dir() or not year_dir.name.isdigit():
-                continue
-
-            for month_dir in year_dir.iterdir():
-                if not month_dir.is_dir() or not month_dir.name.isdigit():
+        # DirEntry carries the file type, so this needs no extra stat per entry;
+        # names are zero-padded by _get_daily_file (YYYY/MM/DD.json, plus DD.jsonl session logs and YYYY/MM.json rollups)
+        with os.scandir(self.data_dir) as years:
+            for year in years:
+                if len(year.name) != 4 or not year.name.isdigit() or not year.is_dir(follow_symlinks=False):
                     continue
 
-                for day_file in month_dir.iterdir():
-                    if day_file.suffix == '.json' and day_file.stem.isdigit():
-                        date_str = f"{year_dir.name}-{month_dir.name.zfill(2)}-{day_file.stem.zfill(2)}"
-                        dates.append(date_str)
+                with os.scandir(year.path) as months:
+                    for month in months:
+                        if len(month.name) == 7 and month.name.endswith('.json') and month.name[:2].isdigit():
+                            # Monthly rollup (YYYY/MM.json)
+                            prefix = f"{year.name}-{month.name[:2]}-"
+                            dates.extend(prefix + day for day in self._load_month(year.name, month.name[:2]))
+                            continue
+                        if len(month.name) != 2 or not month.name.isdigit() or not month.is_dir(follow_symlinks=False):
+                            continue
+
+                        with os.scandir(month.path) as days:
+                            prefix = f"{year.name}-{month.name}-"
+                            # A day may have a daily file, a session log or both
+                            dates.extend(prefix + day.name[:2] for day in days
+                                         if day.name[2:] in ('.json', '.jsonl') and day.name[:2].isdigit())
 
-        return sorted(dates)
+        return sorted(set(dates))
 
 # Compatibility wrapper for existing code
 class TimeTracker(DailyTracker):
@@ -400,12 +861,14 @@ class TimeTracker(DailyTracker):
         """Get all sessions (for compatibility)"""
         all_sessions = []
 
-        for date_str in self.list_available_dates():
-            sessions = self.get_daily_sessions(date_str)
-            all_sessions.extend(sessions)
+        # Newest days first, so a small limit only reads the last few days
+        for date_str in reversed(self.list_available_dates()):
+            all_sessions.extend(self.get_daily_sessions(date_str))
+            if limit and len(all_sessions) >= limit:
+                break
 
         # Sort by start time
-        all_sessions.sort(key=lambda x: x["start"])
+        all_sessions.sort(key=itemgetter("start"))
 
         if limit:
             return all_sessions[-limit:]